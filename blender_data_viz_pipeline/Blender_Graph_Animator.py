@@ -3,6 +3,19 @@ import math
 import csv
 import os
 import traceback
+import numpy as np
+
+# Optional: numba JIT-compiles the label layout math when it is installed
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# Optional: polars speeds up CSV ingestion when it is installed
+try:
+    import polars as pl
+except ImportError:
+    pl = None
 
 # Global Blender version for compatibility checks
 MAJOR_VERSION, MINOR_VERSION, SUB_VERSION = bpy.app.version
@@ -19,6 +32,7 @@ CSV_FILE_PATH = r"C:\Data\Database.csv"  # <--- VERIFY THIS PATH CAREFULLY
 DATA_COLUMN_NAME = "Value"
 MONTH_COLUMN_NAME = "Month"
 DATA_UNIT_SYMBOL = ""  # Changed from CURRENCY_SYMBOL to DATA_UNIT_SYMBOL, default to empty string
+USE_FAST_CSV = True  # Read CSV_FILE_PATH with polars when installed, otherwise fall back to the csv module
 
 GRAPH_ANIM_START_FRAME = 2
 GRAPH_ANIM_LENGTH_DATA = 100  # Adjusted: Made twice as slow (100 * 2 = 200)
@@ -33,6 +47,9 @@ ANIMATED_OBJECT_SCALE = 0.1  # Initial scale for the custom object
 # NEW CONFIGURATION: Control rebuild behavior specific to graph animator
 REBUILD_GRAPH_ON_RUN = False
 
+# Print per-point debug output inside the label/line loops (slow for large data sets)
+DEBUG = False
+
 
 ###########################################################################
 ###########################################################################
@@ -41,6 +58,12 @@ REBUILD_GRAPH_ON_RUN = False
 # --- Global variables for graph specific context ---
 _graph_context = {}
 
+# Inputs and result of the last successful generate_graph_animation call, for skipping identical reruns
+_last_graph_run = {'key': None, 'result': None}
+
+# Reusable float buffers, grown on demand and kept across runs to avoid reallocating per call
+_buffer_pool = {}
+
 
 # --- Helper Functions ---
 
@@ -49,6 +72,146 @@ def print_debug_info(message):
     print(f"[Graph Animator DEBUG] {message}")
 
 
+def load_graph_csv_data(file_path, data_column_name, month_column_name):
+    """
+    Reads the data and month columns from a CSV file.
+    Uses polars when USE_FAST_CSV is set and polars is installed, otherwise the csv module.
+    Rows with an empty data or month value are skipped either way.
+    """
+    if USE_FAST_CSV and pl is not None:
+        try:
+            df = pl.read_csv(
+                file_path,
+                columns=[data_column_name, month_column_name],
+                schema_overrides={data_column_name: pl.Float64, month_column_name: pl.Utf8}
+            )
+        except TypeError as e:
+            # Older polars versions don't know schema_overrides
+            print_debug_info(f"polars CSV reading unavailable ({e}), using the csv module.")
+        else:
+            df = df.drop_nulls()  # Empty cells are read as nulls
+            return df[data_column_name].to_list(), df[month_column_name].to_list()
+
+    data_values = []
+    months = []
+    with open(file_path, 'r', newline='', encoding='utf-8') as csv_file:
+        for row in csv.DictReader(csv_file):
+            data_value = (row.get(data_column_name) or '').strip()
+            month = row.get(month_column_name) or ''
+            if not data_value or not month:
+                continue
+            data_values.append(float(data_value))
+            months.append(month)
+    return data_values, months
+
+
+def get_point_position_arrays(graph_point_positions):
+    """
+    Returns (x_positions, base_zs, visual_scale_factors) as float32 arrays.
+    Accepts a list of {'x_pos', 'base_z', 'visual_scale_factor'} dicts, or a dict holding
+    one array per key, which is used as-is without repacking.
+    """
+    if not graph_point_positions:
+        empty = np.empty(0, dtype=np.float32)
+        return empty, empty, empty
+
+    if isinstance(graph_point_positions, dict):
+        x_positions = np.asarray(graph_point_positions['x_pos'], dtype=np.float32)
+        base_zs = np.asarray(graph_point_positions['base_z'], dtype=np.float32)
+        scales = graph_point_positions.get('visual_scale_factor')
+        if scales is None:
+            scales = np.ones_like(x_positions)
+        return x_positions, base_zs, np.asarray(scales, dtype=np.float32)
+
+    count = len(graph_point_positions)
+    x_positions = np.fromiter((p['x_pos'] for p in graph_point_positions), dtype=np.float32, count=count)
+    base_zs = np.fromiter((p['base_z'] for p in graph_point_positions), dtype=np.float32, count=count)
+    scales = np.fromiter((p.get('visual_scale_factor', 1.0) for p in graph_point_positions), dtype=np.float32, count=count)
+    return x_positions, base_zs, scales
+
+
+def get_pooled_buffer(key, size):
+    """Returns a float32 view of `size` elements from a module-level buffer that only grows when needed."""
+    buffer = _buffer_pool.get(key)
+    if buffer is None or buffer.size < size:
+        buffer = np.empty(size, dtype=np.float32)
+        _buffer_pool[key] = buffer
+    return buffer[:size]
+
+
+def _compute_label_layout(heights, scales, x_positions, min_h, max_h, min_f, max_f, clearance):
+    """
+    Computes font size, value label Z, category label Z and text X for every data point.
+    Pure array math (no bpy), so it is JIT-compiled with numba when available.
+    """
+    # Spans are computed once; the height span is applied as a reciprocal multiply
+    height_span = max_h - min_h
+    font_span = max_f - min_f
+
+    # Normalize model height to a 0-1 range based on min/max reference heights,
+    # defaulting to the middle if the range is zero (e.g., all models same size)
+    if height_span == 0:
+        scaling_ratio = heights * 0.0 + 0.5
+    else:
+        scaling_ratio = (heights - min_h) * (1.0 / height_span)
+
+    # Calculate font size using linear interpolation and clamp
+    font = min_f + scaling_ratio * font_span
+    font = np.clip(font, min_f, max_f)
+
+    # Place labels slightly above the bar tip, scaled by font size
+    value_z = heights + font * 1.0
+    category_z = heights + font * 0.6
+
+    # Text X: model center - half its width (0.5 * visual_scale_factor) - clearance
+    text_x = x_positions - 0.5 * scales - clearance
+    return font, value_z, category_z, text_x
+
+
+if numba is not None:
+    try:
+        _compute_label_layout = numba.njit(cache=True)(_compute_label_layout)
+    except RuntimeError as e:
+        # numba can't cache functions without a source file on disk (e.g. run from Blender's Text Editor);
+        # the plain NumPy version is used then
+        print(f"numba JIT unavailable for label layout, using NumPy: {e}")
+
+
+def remove_data_blocks(data_blocks, data_collection):
+    """
+    Removes a list of data-blocks. Uses a single bpy.data.batch_remove call on Blender 2.93+
+    (one dependency graph update for all of them), and removes them one by one otherwise.
+    """
+    if not data_blocks:
+        return
+    if (MAJOR_VERSION, MINOR_VERSION) >= (2, 93):
+        bpy.data.batch_remove(ids=data_blocks)
+    else:
+        for data_block in data_blocks:
+            data_collection.remove(data_block)
+
+
+def get_or_create_graph_material(material_name, color):
+    """Gets an existing graph material or creates a new node-based one with the given base color."""
+    if material_name in bpy.data.materials:
+        return bpy.data.materials[material_name]
+
+    mat = bpy.data.materials.new(name=material_name)
+    mat.diffuse_color = color
+    mat.use_nodes = True
+    bsdf = mat.node_tree.nodes["Principled BSDF"]
+    bsdf.inputs["Base Color"].default_value = color
+    print_debug_info(f"Created material: {material_name}")
+    return mat
+
+
+def setup_graph_materials():
+    """Creates or reuses the line and text materials shared by all graph elements."""
+    line_mat = get_or_create_graph_material("graph_material_data_points", (0.05, 0.4, 0.8, 1.0)) # Blueish
+    text_mat = get_or_create_graph_material("graph_material_text", (1.0, 1.0, 1.0, 1.0)) # White
+    return line_mat, text_mat
+
+
 def clear_graph_elements():
     """
     Clears all objects and collections previously created by this script.
@@ -61,12 +224,11 @@ def clear_graph_elements():
     graph_collection_name = "Graph_Elements"
     if graph_collection_name in bpy.data.collections:
         graph_collection = bpy.data.collections[graph_collection_name]
-        for obj in list(graph_collection.objects):  # Iterate over a copy of the list
-            bpy.data.objects.remove(obj, do_unlink=True)
+        remove_data_blocks(list(graph_collection.objects), bpy.data.objects)
         # Remove the collection itself if it's empty
         if not graph_collection.objects:
             bpy.data.collections.remove(graph_collection)
-        print_debug_info(f"Removed collection and its objects: {graph_collection.name}")
+        print_debug_info(f"Removed collection and its objects: {graph_collection_name}")
 
     # Clean up any remaining materials
     mats_to_remove = []
@@ -81,8 +243,8 @@ def clear_graph_elements():
             if not is_used:
                 mats_to_remove.append(mat)
     for mat in mats_to_remove:
-        bpy.data.materials.remove(mat)
-        print_debug_info(f"Removed unused material: {mat.name}")
+        print_debug_info(f"Removing unused material: {mat.name}")
+    remove_data_blocks(mats_to_remove, bpy.data.materials)
 
     # Clean up any remaining curves
     curves_to_remove = []
@@ -91,8 +253,8 @@ def clear_graph_elements():
             if not curve.users:  # Check if it has no users (objects using this curve data)
                 curves_to_remove.append(curve)
     for curve in curves_to_remove:
-        bpy.data.curves.remove(curve)
-        print_debug_info(f"Removed unused curve data: {curve.name}")
+        print_debug_info(f"Removing unused curve data: {curve.name}")
+    remove_data_blocks(curves_to_remove, bpy.data.curves)
 
     print_debug_info("Graph elements cleanup complete.")
 
@@ -104,6 +266,14 @@ def create_graph_curve_path(graph_data_values, graph_point_positions, graph_anim
     """
     print_debug_info("Creating graph curve path...")
 
+    # Add points based on graph_point_positions
+    # We need at least 2 points to create a spline
+    x_positions, base_zs, _ = get_point_position_arrays(graph_point_positions)
+    number_of_points = len(x_positions)
+    if number_of_points < 2:
+        print_debug_info("Not enough points to create a curve path. Minimum 2 points required.")
+        return None
+
     # Create a new curve datablock
     curve_data = bpy.data.curves.new(name="data_curve", type='CURVE')
     curve_data.dimensions = '3D'
@@ -112,19 +282,19 @@ def create_graph_curve_path(graph_data_values, graph_point_positions, graph_anim
     # Create a new spline in the curve
     spline = curve_data.splines.new(type='BEZIER')
 
-    # Add points based on graph_point_positions
-    # We need at least 2 points to create a spline
-    if not graph_point_positions or len(graph_point_positions) < 2:
-        print_debug_info("Not enough points to create a curve path. Minimum 2 points required.")
-        return None
-
     # Resize points array to match the number of positions
-    spline.bezier_points.add(len(graph_point_positions) - 1)
-
-    for i, pos_data in enumerate(graph_point_positions):
-        point = spline.bezier_points[i]
-        x, z = pos_data['x_pos'], pos_data['base_z']
-        point.co = (x, 0, z)  # X, 0 for Y (flat on XZ plane), Z
+    spline.bezier_points.add(number_of_points - 1)
+
+    # Write all point coordinates in one call as flat (X, 0, Z) triples (Y=0 keeps the curve flat on the XZ plane)
+    coords = get_pooled_buffer("co", number_of_points * 3)
+    coords[1::3] = 0.0
+    coords[0::3] = x_positions
+    coords[2::3] = base_zs
+    spline.bezier_points.foreach_set("co", coords)
+
+    # Handle types are enum properties, which foreach_set cannot write, so they are set per point.
+    # Setting them after the coordinates lets Blender recalculate the AUTO handles from the final positions.
+    for point in spline.bezier_points:
         point.handle_left_type = 'AUTO'
         point.handle_right_type = 'AUTO'
 
@@ -209,30 +379,66 @@ def setup_path_animation(animated_obj, curve_path_obj, graph_anim_start_frame, a
     print_debug_info(f"Path animation keyframed from frame {graph_anim_start_frame} to {graph_anim_start_frame + anim_duration}.")
 
 
-def create_data_labels(graph_data_values, graph_category_labels, data_unit_symbol, graph_point_positions, graph_collection):
+def get_label_camera():
+    """
+    Returns the 'Camera' object that labels copy their rotation from, cached in _graph_context.
+    The lookup is redone if the cached object was removed or renamed.
+    """
+    camera_obj = _graph_context.get('camera_obj')
+    try:
+        if camera_obj is not None and camera_obj.name == 'Camera':
+            return camera_obj
+    except ReferenceError:
+        pass  # Cached camera was removed from bpy.data
+    camera_obj = bpy.data.objects.get('Camera')
+    _graph_context['camera_obj'] = camera_obj
+    return camera_obj
+
+
+def create_text_object(name, body, location, size, text_mat, camera_obj, graph_collection):
+    """
+    Creates a 3D text object directly through bpy.data (no operator, no context
+    collection link) and makes it copy the camera's world rotation.
+    """
+    text_data = bpy.data.curves.new(name=name, type='FONT')
+    text_data.body = body
+    text_data.align_x = 'RIGHT' # Text's right edge is at location.x, extending left
+    text_data.extrude = 0.01 # Make text 3D
+    text_data.size = size
+    if text_mat:
+        text_data.materials.append(text_mat)
+
+    text_obj = bpy.data.objects.new(name, text_data)
+    text_obj.location = location
+    graph_collection.objects.link(text_obj)
+
+    # Add Copy Rotation constraint to make text rotate exactly with the camera.
+    # Each label keeps its own constraint: parenting labels to one rotating pivot
+    # would swing them around the pivot's origin instead of turning them in place.
+    if camera_obj:
+        copy_rot_constraint = text_obj.constraints.new(type='COPY_ROTATION')
+        copy_rot_constraint.target = camera_obj
+        copy_rot_constraint.owner_space = 'WORLD' # Copy world rotation
+        copy_rot_constraint.target_space = 'WORLD' # Copy world rotation
+
+    return text_obj
+
+
+def create_data_labels(graph_data_values, graph_category_labels, data_unit_symbol, graph_point_positions, text_mat, graph_collection):
     """
     Creates text objects for data values and category labels.
     Text size scales with model height, and text faces the camera by copying camera's rotation.
     """
     print_debug_info("Creating data labels...")
-    if not graph_data_values or not graph_point_positions:
+    x_positions, heights, scales = get_point_position_arrays(graph_point_positions)
+    if not graph_data_values or not len(x_positions):
         print_debug_info("No data or positions to create labels from.")
         return []
 
     labels = []
-    # Create materials for labels
-    if "graph_material_text" not in bpy.data.materials:
-        text_mat = bpy.data.materials.new(name="graph_material_text")
-        text_mat.diffuse_color = (1.0, 1.0, 1.0, 1.0) # White
-        text_mat.use_nodes = True
-        bsdf = text_mat.node_tree.nodes["Principled BSDF"]
-        bsdf.inputs["Base Color"].default_value = (1.0, 1.0, 1.0, 1.0) # White
-        print_debug_info("Created material: graph_material_text")
-    else:
-        text_mat = bpy.data.materials["graph_material_text"]
 
     # Get the main camera object (assuming it exists and is named 'Camera')
-    camera_obj = bpy.data.objects.get('Camera')
+    camera_obj = get_label_camera()
     if not camera_obj:
         print_debug_info("Warning: 'Camera' object not found. Text will not be tracked to camera.")
 
@@ -251,131 +457,61 @@ def create_data_labels(graph_data_values, graph_category_labels, data_unit_symbo
     # Y position offset (not aligned at y=0)
     text_y_position = -1.0 # Increased negative offset in Y to prevent overlap
 
-    for i, (value, category, pos_data) in enumerate(zip(graph_data_values, graph_category_labels, graph_point_positions)):
-        x_model_center = pos_data['x_pos']
-        z_model_top = pos_data['base_z']
-        # Retrieve the visual_scale_factor from pos_data, defaulting to 1.0 if not present
-        visual_scale_factor = pos_data.get('visual_scale_factor', 1.0) 
-
-        print_debug_info(f"Creating labels for point {i}: x={x_model_center}, z={z_model_top}, scale={visual_scale_factor}, value={value}, category={category}")
-
-        # Calculate dynamic font size based on model height
-        model_height = z_model_top # Use base_z as model_height for scaling font size
-        
-        # Avoid division by zero if min and max model heights are the same
-        if max_model_height_ref - min_model_height_ref == 0:
-            scaling_ratio = 0.5 # Default to middle if range is zero (e.g., all models same size)
-        else:
-            # Normalize model_height to a 0-1 range based on min/max reference heights
-            scaling_ratio = (model_height - min_model_height_ref) / (max_model_height_ref - min_model_height_ref)
-        
-        # Calculate font size using linear interpolation and clamp
-        calculated_font_size = min_font_size_clamp + scaling_ratio * (max_font_size_clamp - min_font_size_clamp)
-        calculated_font_size = max(min_font_size_clamp, min(max_font_size_clamp, calculated_font_size)) # Final clamping
-
-        # Adjusted vertical positions based on font size to place them slightly above the bar tip
-        value_z_offset = calculated_font_size * 1.0 
-        category_z_offset = calculated_font_size * 0.6 
-
-        # Calculate the X position for the text: model center - half its width - clearance
-        # Assuming TARGET_BASE_DIMENSION (from Stats_Generator) defines the base width, usually 1.0
-        # The model's actual half-width in X (or overall horizontal footprint) will be 0.5 * visual_scale_factor
-        model_half_width = 0.5 * visual_scale_factor 
-        text_x_position = x_model_center - model_half_width - text_horizontal_clearance
+    # Compute every label's font size and placement in one pass, then only do bpy work in the loop
+    font_sizes, value_zs, category_zs, text_xs = (
+        layout.tolist() for layout in _compute_label_layout(
+            heights, scales, x_positions,
+            min_model_height_ref, max_model_height_ref,
+            min_font_size_clamp, max_font_size_clamp,
+            text_horizontal_clearance
+        )
+    )
 
+    for i, (value, category, calculated_font_size, value_z, category_z, text_x_position) in enumerate(
+            zip(graph_data_values, graph_category_labels, font_sizes, value_zs, category_zs, text_xs)):
+        if DEBUG:
+            print_debug_info(f"Creating labels for point {i}: x={x_positions[i]}, z={heights[i]}, scale={scales[i]}, value={value}, category={category}")
 
         # Value label
         value_text = f"{value}{data_unit_symbol}"
         # Position text to the left of the model with Y-offset
-        bpy.ops.object.text_add(enter_editmode=False, align='WORLD', location=(text_x_position, text_y_position, z_model_top + value_z_offset))
-        value_obj = bpy.context.active_object
-        value_obj.data.body = value_text
-        value_obj.data.align_x = 'RIGHT' # Text's right edge is at text_x_position, extending left
-        value_obj.name = f"Data_Value_Label_{i}"
-        value_obj.data.extrude = 0.01 # Make text 3D
-        value_obj.data.size = calculated_font_size # Apply dynamic font size
-        if text_mat:
-            if len(value_obj.data.materials) == 0:
-                value_obj.data.materials.append(text_mat)
-            else:
-                value_obj.data.materials[0] = text_mat
-        graph_collection.objects.link(value_obj)
-
-        # Ensure all existing TRACK_TO constraints are removed
-        for constraint in list(value_obj.constraints):
-            if constraint.type == 'TRACK_TO':
-                value_obj.constraints.remove(constraint)
-
-        # Add Copy Rotation constraint to make text rotate exactly with the camera
-        if camera_obj:
-            copy_rot_constraint = value_obj.constraints.new(type='COPY_ROTATION')
-            copy_rot_constraint.target = camera_obj
-            copy_rot_constraint.owner_space = 'WORLD' # Copy world rotation
-            copy_rot_constraint.target_space = 'WORLD' # Copy world rotation
-
-
+        value_obj = create_text_object(
+            f"Data_Value_Label_{i}", value_text,
+            (text_x_position, text_y_position, value_z),
+            calculated_font_size, text_mat, camera_obj, graph_collection
+        )
         labels.append(value_obj)
 
         # Category label (optional, if category data is meaningful)
         if category:
             # Position text to the left of the model with Y-offset
-            bpy.ops.object.text_add(enter_editmode=False, align='WORLD', location=(text_x_position, text_y_position, z_model_top + category_z_offset))
-            category_obj = bpy.context.active_object
-            category_obj.data.body = str(category)
-            category_obj.data.align_x = 'RIGHT' # Text's right edge is at text_x_position, extending left
-            category_obj.name = f"Category_Label_{i}"
-            category_obj.data.extrude = 0.01 # Make text 3D
-            category_obj.data.size = calculated_font_size * 0.8 # Category a bit smaller than value
-            if text_mat:
-                if len(category_obj.data.materials) == 0:
-                    category_obj.data.materials.append(text_mat)
-                else:
-                    category_obj.data.materials[0] = text_mat
-            graph_collection.objects.link(category_obj)
-
-            # Ensure all existing TRACK_TO constraints are removed
-            for constraint in list(category_obj.constraints):
-                if constraint.type == 'TRACK_TO':
-                    category_obj.constraints.remove(constraint)
-
-            # Add Copy Rotation constraint to make text rotate exactly with the camera
-            if camera_obj:
-                copy_rot_constraint = category_obj.constraints.new(type='COPY_ROTATION')
-                copy_rot_constraint.target = camera_obj
-                copy_rot_constraint.owner_space = 'WORLD'
-                copy_rot_constraint.target_space = 'WORLD'
-
+            category_obj = create_text_object(
+                f"Category_Label_{i}", str(category),
+                (text_x_position, text_y_position, category_z),
+                calculated_font_size * 0.8, # Category a bit smaller than value
+                text_mat, camera_obj, graph_collection
+            )
             labels.append(category_obj)
 
     print_debug_info(f"Created {len(labels)} data and category labels.")
     return labels
 
 
-def create_vertical_lines(graph_point_positions, min_visual_scale, graph_collection):
+def create_vertical_lines(graph_point_positions, min_visual_scale, line_mat, graph_collection):
     """
     Creates vertical lines from the base of the scene to the data points.
     """
     print_debug_info("Creating vertical lines...")
-    if not graph_point_positions:
+    x_positions, base_zs, _ = get_point_position_arrays(graph_point_positions)
+    if not len(x_positions):
         print_debug_info("No data to create vertical lines from.")
         return []
 
     lines = []
-    # Create materials for lines
-    if "graph_material_data_points" not in bpy.data.materials:
-        line_mat = bpy.data.materials.new(name="graph_material_data_points")
-        line_mat.diffuse_color = (0.05, 0.4, 0.8, 1.0) # Blueish
-        line_mat.use_nodes = True
-        bsdf = line_mat.node_tree.nodes["Principled BSDF"]
-        bsdf.inputs["Base Color"].default_value = (0.05, 0.4, 0.8, 1.0) # Blueish
-        print_debug_info("Created material: graph_material_data_points")
-    else:
-        line_mat = bpy.data.materials["graph_material_data_points"]
-
 
-    for i, pos_data in enumerate(graph_point_positions):
-        x, z = pos_data['x_pos'], pos_data['base_z']
-        print_debug_info(f"Creating vertical line for point {i}: x={x}, z={z}")
+    for i, (x, z) in enumerate(zip(x_positions.tolist(), base_zs.tolist())):
+        if DEBUG:
+            print_debug_info(f"Creating vertical line for point {i}: x={x}, z={z}")
 
         # Ensure z (depth) is positive and not too small for cylinder creation
         # Add a very small epsilon if z is effectively zero or negative to prevent issues with primitive creation.
@@ -416,8 +552,12 @@ class GraphAnimatorOperator(bpy.types.Operator):
         try:
             # Parameters will be passed programmatically, but define them for operator registration
             # These will be overridden by the call from Init_Blender_Animation.py
-            graph_data_values = [10, 20, 15, 25, 30]
-            graph_category_labels = ["Jan", "Feb", "Mar", "Apr", "May"]
+            if os.path.exists(CSV_FILE_PATH):
+                graph_data_values, graph_category_labels = load_graph_csv_data(
+                    CSV_FILE_PATH, DATA_COLUMN_NAME, MONTH_COLUMN_NAME)
+            else:
+                graph_data_values = [10, 20, 15, 25, 30]
+                graph_category_labels = ["Jan", "Feb", "Mar", "Apr", "May"]
             data_unit_symbol = DATA_UNIT_SYMBOL
             graph_anim_start_frame = GRAPH_ANIM_START_FRAME
             graph_anim_length_data = GRAPH_ANIM_LENGTH_DATA
@@ -467,6 +607,24 @@ def generate_graph_animation(graph_data_values, graph_category_labels, data_unit
     print("STARTING BLENDER GRAPH ANIMATOR SCRIPT (Programmatic Call)")
     print("=" * 50)
 
+    # Skip the rebuild entirely if the inputs match the last run and its graph is still in the scene
+    x_positions, base_zs, scales = get_point_position_arrays(graph_point_positions)
+    run_key = (
+        tuple(graph_data_values or ()), tuple(graph_category_labels or ()), data_unit_symbol,
+        graph_anim_start_frame, graph_anim_length_data, graph_start_position, graph_x_axis_spread,
+        animated_object_type, animated_object_name, animated_object_scale,
+        x_positions.tobytes(), base_zs.tobytes(), scales.tobytes()
+    )
+    last_result = _last_graph_run['result']
+    if (not rebuild_graph_on_run and last_result and run_key == _last_graph_run['key']
+            and last_result["graph_collection_name"] in bpy.data.collections
+            and (last_result["curve_object_name"] is None or last_result["curve_object_name"] in bpy.data.objects)):
+        print_debug_info("Inputs unchanged since the last run and graph elements still exist. Skipping rebuild.")
+        return last_result
+
+    # Drop cached data-block references from earlier runs; they may not survive undo or file reloads
+    _graph_context.clear()
+
     if rebuild_graph_on_run:
         clear_graph_elements()
 
@@ -491,6 +649,10 @@ def generate_graph_animation(graph_data_values, graph_category_labels, data_unit
     all_labels = []
     all_lines = []
 
+    # Create (or reuse) the graph materials once and hand them to the element creators
+    print_debug_info("Checking/creating graph materials...")
+    line_mat, text_mat = setup_graph_materials()
+
     # If graph_point_positions are provided (from Stats_Generator), use them
     # Otherwise, calculate default positions based on graph_start_position and graph_x_axis_spread
     if graph_point_positions:
@@ -501,34 +663,12 @@ def generate_graph_animation(graph_data_values, graph_category_labels, data_unit
         # For now, let's assume a small default if not explicitly available.
         temp_min_visual_scale = 0.5 
         
-        # Create materials for graph elements
-        print_debug_info("Checking/creating graph materials...")
-        if "graph_material_data_points" not in bpy.data.materials:
-            line_mat = bpy.data.materials.new(name="graph_material_data_points")
-            line_mat.diffuse_color = (0.05, 0.4, 0.8, 1.0) # Blueish
-            line_mat.use_nodes = True
-            bsdf = line_mat.node_tree.nodes["Principled BSDF"]
-            bsdf.inputs["Base Color"].default_value = (0.05, 0.4, 0.8, 1.0) # Blueish
-            print_debug_info("Created material: graph_material_data_points")
-        else:
-            line_mat = bpy.data.materials["graph_material_data_points"]
-
-        if "graph_material_text" not in bpy.data.materials:
-            text_mat = bpy.data.materials.new(name="graph_material_text")
-            text_mat.diffuse_color = (1.0, 1.0, 1.0, 1.0) # White
-            text_mat.use_nodes = True
-            bsdf = text_mat.node_tree.nodes["Principled BSDF"]
-            bsdf.inputs["Base Color"].default_value = (1.0, 1.0, 1.0, 1.0) # White
-            print_debug_info("Created material: graph_material_text")
-        else:
-            text_mat = bpy.data.materials["graph_material_text"]
-
         print_debug_info("Calling create_vertical_lines...")
-        all_lines = create_vertical_lines(graph_point_positions, temp_min_visual_scale, graph_collection)
+        all_lines = create_vertical_lines(graph_point_positions, temp_min_visual_scale, line_mat, graph_collection)
         print_debug_info("Finished create_vertical_lines.")
 
         print_debug_info("Calling create_data_labels...")
-        all_labels = create_data_labels(graph_data_values, graph_category_labels, data_unit_symbol, graph_point_positions, graph_collection)
+        all_labels = create_data_labels(graph_data_values, graph_category_labels, data_unit_symbol, graph_point_positions, text_mat, graph_collection)
         print_debug_info("Finished create_data_labels.")
 
         print_debug_info("Calling create_graph_curve_path...")
@@ -548,22 +688,21 @@ def generate_graph_animation(graph_data_values, graph_category_labels, data_unit
         print_debug_info("No graph_point_positions provided. Calculating default positions (Fallback).")
         # Fallback to older behavior if graph_point_positions is not provided
         # This path should ideally not be taken if Init_Blender_Animation is working correctly
-        current_x = graph_start_position
-        # Ensure graph_point_positions is a mutable list for appending in this fallback
-        graph_point_positions = []
-        for i, value in enumerate(graph_data_values):
-            x = current_x
-            z = value * 0.1 # Simple scaling for graph points if no stats data
-            graph_point_positions.append({'x_pos': x, 'base_z': z, 'visual_scale_factor': 1.0}) # Append to an empty list, add default scale
-            current_x += graph_x_axis_spread
+        # Evenly spaced points from graph_start_position, passed on as arrays (no per-point dicts)
+        x_positions = np.arange(number_of_data, dtype=np.float32) * graph_x_axis_spread + graph_start_position
+        graph_point_positions = {
+            'x_pos': x_positions,
+            'base_z': np.asarray(graph_data_values, dtype=np.float32) * 0.1, # Simple scaling for graph points if no stats data
+            'visual_scale_factor': np.ones(number_of_data, dtype=np.float32) # Default scale
+        }
 
         curve_path_obj = create_graph_curve_path(graph_data_values, graph_point_positions, graph_anim_start_frame, graph_anim_length_data, graph_collection)
         if curve_path_obj:
             animated_obj = create_animated_object(animated_object_type, animated_object_name, animated_object_scale, graph_collection)
             if animated_obj:
                 setup_path_animation(animated_obj, curve_path_obj, graph_anim_start_frame, anim_duration)
-        all_labels = create_data_labels(graph_data_values, graph_category_labels, data_unit_symbol, graph_point_positions, graph_collection)
-        all_lines = create_vertical_lines(graph_point_positions, 0.5, graph_collection) # Default thickness
+        all_labels = create_data_labels(graph_data_values, graph_category_labels, data_unit_symbol, graph_point_positions, text_mat, graph_collection)
+        all_lines = create_vertical_lines(graph_point_positions, 0.5, line_mat, graph_collection) # Default thickness
 
     # Set Blender's scene end frame if animation goes beyond current end frame
     anim_end_frame = graph_anim_start_frame + anim_duration + graph_anim_length_data # Add some buffer frames
@@ -574,7 +713,7 @@ def generate_graph_animation(graph_data_values, graph_category_labels, data_unit
     print("Please check the 'Graph_Elements' collection in your Blender Outliner.")
 
     # Return key information for the Init script
-    return {
+    result = {
         "graph_collection_name": graph_collection.name,
         "curve_object_name": curve_path_obj.name if curve_path_obj else None,
         "animated_object_name": animated_obj.name if animated_obj else None,
@@ -582,6 +721,9 @@ def generate_graph_animation(graph_data_values, graph_category_labels, data_unit
         "animation_end_frame": anim_end_frame,
         "number_of_data_points": number_of_data
     }
+    _last_graph_run['key'] = run_key
+    _last_graph_run['result'] = result
+    return result
 
 
 def register():
@@ -1,9 +1,20 @@
+# Init_Blender_Animation.py - entry point of the data visualization pipeline.
+#
+# Development: set the environment variable ANIM_PIPELINE_DEV_RELOAD=1 before starting Blender
+# to re-import (importlib.reload) Stats_Generator, Blender_Graph_Animator and Blender_Camera_Animator
+# on every run, so edits to those scripts are picked up. Without it they are imported once and reused.
 import bpy
 import os
 import sys
 import importlib
-import traceback
+import importlib.util
 import math
+from operator import itemgetter
+from types import MappingProxyType
+import numpy as np
+
+# Global Blender version for compatibility checks
+MAJOR_VERSION, MINOR_VERSION, SUB_VERSION = bpy.app.version
 
 # --- VERY EARLY DEBUG PRINT ---
 print("--- Init_Blender_Animation.py: Script started execution ---")
@@ -29,63 +40,29 @@ elif script_dir:
 else:
     print("ERROR: Script directory not set. Path resolution failed.")
 
-# Flags to track successful imports
-stats_generator_imported = False
-blender_graph_animator_imported = False
-blender_camera_animator_imported = False
-
-# Attempt to import the other scripts
-try:
-    import Stats_Generator
-    stats_generator_imported = True
-    import Blender_Graph_Animator
-    blender_graph_animator_imported = True
-    import Blender_Camera_Animator
-    blender_camera_animator_imported = True
-    print("Successfully imported Stats_Generator, Blender_Graph_Animator, Blender_Camera_Animator.")
-except ImportError as e:
-    print(f"Error importing required scripts: {e}")
-    print(
-        "Please ensure 'Stats_Generator.py', 'Blender_Graph_Animator.py', and 'Blender_Camera_Animator.py' are in the directory specified in 'script_dir'.")
-    # Do NOT sys.exit() here, as it might prevent the console from showing the error
-    # Let the script continue to register the operator if possible, but it will likely fail later.
-except Exception as e:
-    print(f"An unexpected error occurred during module import: {e}")
-    traceback.print_exc()
-
-# Reload modules only if they were successfully imported
-if stats_generator_imported:
-    try:
-        importlib.reload(Stats_Generator)
-        print("Reloaded Stats_Generator.")
-    except Exception as e:
-        print(f"Error reloading Stats_Generator: {e}")
-        traceback.print_exc()
-if blender_graph_animator_imported:
-    try:
-        importlib.reload(Blender_Graph_Animator)
-        print("Reloaded Blender_Graph_Animator.")
-    except Exception as e:
-        print(f"Error reloading Blender_Graph_Animator: {e}")
-        traceback.print_exc()
-if blender_camera_animator_imported:
-    try:
-        importlib.reload(Blender_Camera_Animator)
-        print("Reloaded Blender_Camera_Animator.")
-    except Exception as e:
-        print(f"Error reloading Blender_Camera_Animator: {e}")
-        traceback.print_exc()
+# The other pipeline scripts are imported lazily by load_pipeline_modules() the first time
+# the pipeline runs, so registering the panel does not pay for importing them.
+PIPELINE_MODULE_NAMES = ("Stats_Generator", "Blender_Graph_Animator", "Blender_Camera_Animator")
+
+# Set this environment variable to "1" to re-import (importlib.reload) the pipeline scripts on every run while developing
+DEV_RELOAD_ENV_VAR = "ANIM_PIPELINE_DEV_RELOAD"
+
+# Imported pipeline modules, keyed by module name
+_pipeline_modules = {}
 
 # --- GLOBAL USER CONFIGURATION ---
 # All user-configurable parameters are defined here.
+# Each group is wrapped in a read-only MappingProxyType so it cannot be changed by accident during a run.
 
-GLOBAL_SCENE_CONFIG = {
+GLOBAL_SCENE_CONFIG = MappingProxyType({
     "REBUILD_ALL_ON_RUN": True,  # Set to True to clear all script-generated elements and rebuild from scratch
     "SAVE_BLENDER_FILE_AFTER_RUN": False,
-    "BLENDER_SAVE_PATH": r"C:\BlenderProjects\MyDataVizAnimation.blend"
-}
+    "BLENDER_SAVE_PATH": r"C:\BlenderProjects\MyDataVizAnimation.blend",
+    "USE_TIMER_YIELD": True,  # On very large runs, let the UI refresh once before graph/camera animation
+    "TIMER_YIELD_MIN_MODELS": 5000  # Model count above which USE_TIMER_YIELD applies
+})
 
-STATS_GENERATOR_CONFIG = {
+STATS_GENERATOR_CONFIG = MappingProxyType({
     "MODEL_PATH": r"C:\Users\User\Downloads\sphere.glb",  # <--- UPDATE THIS PATH to your 3D model
     "CSV_FILE_PATH": r"C:\Data\WorldStats.csv",  # <--- UPDATE THIS PATH to your CSV data
     "VISUALIZATION_NAME": "CountryGDP_Viz",
@@ -102,11 +79,11 @@ STATS_GENERATOR_CONFIG = {
     "MIN_CLEARANCE_BETWEEN_MODELS": 2.0,
     "MODEL_COLOR": (0.8, 0.2, 0.1, 1.0),  # RGBA (Reddish)
     "TARGET_BASE_DIMENSION": 1.0,  # Ensures source model has a consistent horizontal footprint
-    "BATCH_SIZE": 10,  # Number of models to process per batch (for efficiency)
-    "BATCH_DELAY_SECONDS": 0.01  # Delay between batches
-}
+    "BATCH_SIZE": 64,  # Number of models placed per timer tick (for efficiency)
+    "BATCH_DELAY_SECONDS": 0.0 if bpy.app.background else 0.01  # Delay between batches (none when running headless)
+})
 
-GRAPH_ANIMATOR_CONFIG = {
+GRAPH_ANIMATOR_CONFIG = MappingProxyType({
     # GRAPH_CSV_FILE_PATH, GRAPH_DATA_COLUMN, GRAPH_MONTH_COLUMN are now only for fallback if stats_generator data is not used
     "GRAPH_CSV_FILE_PATH": r"C:\Data\Database.csv",
     # <--- This path is now only used if Stats_Generator data is unavailable
@@ -121,9 +98,9 @@ GRAPH_ANIMATOR_CONFIG = {
     "ANIMATED_OBJECT_NAME": "Animated_Graph_Object",
     "ANIMATED_OBJECT_SCALE": 0.1,
     "REBUILD_GRAPH_ON_RUN": False,  # Graph animator also has its own rebuild flag
-}
+})
 
-CAMERA_ANIMATOR_CONFIG = {
+CAMERA_ANIMATOR_CONFIG = MappingProxyType({
     "CAMERA_MODE": 'SIDEWAYS_TRACKING_VIEW',  # 'SIDEWAYS_TRACKING_VIEW' or 'OVERHEAD_TRACKING_VIEW'
     "MIN_CAMERA_CLEARANCE": 2.0,  # Minimum distance camera must maintain from any object
     "DYNAMIC_MOVEMENT_INTENSITY": 1.0,  # Multiplier for overall camera's dynamic shifts
@@ -135,142 +112,235 @@ CAMERA_ANIMATOR_CONFIG = {
     # --- NEW BASE CAMERA OFFSETS ---
     "CAMERA_BASE_VERTICAL_OFFSET_FACTOR": 0.2, # Multiplier for max_dim to set base camera Z-offset (smaller = lower)
     "CAMERA_BASE_HORIZONTAL_OFFSET_FACTOR": 1.5 # Multiplier for min_camera_clearance to set sideways X-offset (larger = further)
-}
+})
 
 
 # --- END GLOBAL USER CONFIGURATION ---
 
 
+# --- Names of data-blocks created by the pipeline scripts (used by the full cleanup) ---
+_SCRIPT_COLLECTION_PREFIXES = (
+    "Viz_",
+    "Source_",
+    "CountryGDP_Viz_",  # Specific to Stats_Generator default
+)
+_SCRIPT_COLLECTION_NAMES = frozenset({
+    "Graph_Elements",
+    "Camera_Animations",
+    "TEMP_Import_Collection_For_Centering",  # From Stats_Generator temp
+})
+_SCRIPT_MATERIAL_PREFIXES = ("Model_Material", "graph_material_")
+_SCRIPT_CURVE_PREFIXES = ("data_curve", "Dynamic_Camera_Path")
+
+
 def print_status(message):
     """Helper function to print status messages."""
     print(f"\n--- {message} ---")
 
 
-def clear_all_script_generated_elements():
+def remove_data_blocks(data_blocks, data_collection):
+    """
+    Removes a list of data-blocks. Uses a single bpy.data.batch_remove call on Blender 2.93+
+    (one dependency graph update for all of them), and removes them one by one otherwise.
+    """
+    if not data_blocks:
+        return
+    if (MAJOR_VERSION, MINOR_VERSION) >= (2, 93):
+        bpy.data.batch_remove(ids=data_blocks)
+    else:
+        for data_block in data_blocks:
+            data_collection.remove(data_block)
+
+
+def get_recycled_duplicates_collection_name(model_path):
+    """
+    Returns the name of the model duplicates collection Stats_Generator builds for model_path
+    ("Viz_<model>_Duplicates"). Stats_Generator rebuilds it itself and recycles its objects.
+    """
+    model_file_name = os.path.splitext(os.path.basename(model_path))[0]
+    return f"Viz_{model_file_name}_Duplicates"
+
+
+def clear_all_script_generated_elements(keep_collection_names=()):
     """
     Clears all collections and objects created by these scripts.
     This is a more aggressive cleanup for a full rebuild.
+    Collections named in keep_collection_names (and their objects) are left in place.
     """
     print_status("Initiating full scene cleanup for rebuild...")
 
-    collections_to_remove = [
-        col for col in bpy.data.collections
-        if col.name.startswith("Viz_") or
-           col.name.startswith("Source_") or
-           col.name.startswith("CountryGDP_Viz_") or  # Specific to Stats_Generator default
-           col.name == "Graph_Elements" or
-           col.name == "Camera_Animations" or
-           col.name == "TEMP_Import_Collection_For_Centering"  # From Stats_Generator temp
-    ]
-
-    # Deselect all objects first
-    bpy.ops.object.select_all(action='DESELECT')
-
-    # Delete objects linked to these collections
+    # Local references to the data collections used below
+    blend_data = bpy.data
+    data_collections = blend_data.collections
+    data_meshes = blend_data.meshes
+    data_materials = blend_data.materials
+    data_curves = blend_data.curves
+
+    # One pass over the collections, reading each name only once
+    collections_to_remove = []
+    for col in data_collections:
+        col_name = col.name
+        if col_name in keep_collection_names:
+            continue
+        if col_name.startswith(_SCRIPT_COLLECTION_PREFIXES) or col_name in _SCRIPT_COLLECTION_NAMES:
+            collections_to_remove.append(col)
+
+    # Deselect all objects first (directly on the selected objects, without going through the operator)
+    for obj in list(bpy.context.view_layer.objects.selected):
+        obj.select_set(False)
+
+    # Gather every object linked to these collections, then delete them in one batch
+    objs_to_remove = set()
     for collection in collections_to_remove:
         print(f"Cleaning collection: {collection.name}")
-        for obj in list(collection.objects):  # Iterate over a copy of the list
-            # Preserve the default scene camera if it's not our main viz camera
-            if obj.name == "Camera" and obj.name != "Main_Visualization_Camera":
+        for obj in collection.objects:
+            # Preserve the default scene camera (never the main viz camera, which has its own name)
+            if obj.name == "Camera":
                 continue
+            objs_to_remove.add(obj)
+    # Removing an object unlinks it from every collection it is in
+    remove_data_blocks(objs_to_remove, blend_data.objects)
 
-                # Unlink from all collections it's part of
-            for coll in list(obj.users_collection):
-                coll.objects.unlink(obj)
-            # Remove if no other collections are using it
-            if not obj.users_collection:
-                bpy.data.objects.remove(obj, do_unlink=True)
-            else:
-                print(f"Object '{obj.name}' still linked to other collections, not deleting.")
-
-    # Delete the collections themselves, in reverse order of creation (children first)
-    for collection in reversed(collections_to_remove):
-        if collection.name in bpy.data.collections:
-            # Ensure it's empty before removal
-            if not collection.objects and not collection.children:
-                bpy.data.collections.remove(collection)
-                print(f"Removed collection: {collection.name}")
-            else:
-                print(f"Collection '{collection.name}' not empty, skipping removal.")
+    # Delete the collections themselves, but only those left empty (no remaining objects,
+    # and every child collection is also being removed)
+    collection_candidates = set(collections_to_remove)
+
+    def is_removable(collection):
+        return not collection.objects and all(
+            child in collection_candidates and is_removable(child) for child in collection.children)
+
+    removable_collections = set()
+    for collection in collections_to_remove:
+        if is_removable(collection):
+            print(f"Removing collection: {collection.name}")
+            removable_collections.add(collection)
+        else:
+            print(f"Collection '{collection.name}' not empty, skipping removal.")
+    remove_data_blocks(removable_collections, data_collections)
 
     # Clean up any remaining materials created by the scripts
-    mats_to_remove = []
-    for mat in bpy.data.materials:
-        if mat.name.startswith("Model_Material") or mat.name.startswith("graph_material_"):
-            is_used = False
-            for mesh in bpy.data.meshes:
-                if mat in mesh.materials:
-                    is_used = True
-                    break
-            if not is_used:
-                mats_to_remove.append(mat)
-    for mat in mats_to_remove:
-        bpy.data.materials.remove(mat)
-        print(f"Removed unused material: {mat.name}")
+    # Collect every material used by a mesh in one pass, instead of scanning all meshes per material
+    used_materials = {mat for mesh in data_meshes for mat in mesh.materials if mat}
+    mats_to_remove = set()
+    for mat in data_materials:
+        if mat.name.startswith(_SCRIPT_MATERIAL_PREFIXES) and mat not in used_materials:
+            print(f"Removing unused material: {mat.name}")
+            mats_to_remove.add(mat)
+    remove_data_blocks(mats_to_remove, data_materials)
 
     # Clean up any remaining curves
-    curves_to_remove = []
-    for curve in bpy.data.curves:
-        if curve.name.startswith("data_curve") or curve.name.startswith("Dynamic_Camera_Path"):
+    curves_to_remove = set()
+    for curve in data_curves:
+        if curve.name.startswith(_SCRIPT_CURVE_PREFIXES):
             if not curve.users:  # Check if it has no users (objects using this curve data)
-                curves_to_remove.append(curve)
-    for curve in curves_to_remove:
-        bpy.data.curves.remove(curve)
-        print(f"Removed unused curve data: {curve.name}")
+                print(f"Removing unused curve data: {curve.name}")
+                curves_to_remove.add(curve)
+    remove_data_blocks(curves_to_remove, data_curves)
 
     print_status("Full scene cleanup complete.")
 
 
+def load_pipeline_modules():
+    """
+    Imports Stats_Generator, Blender_Graph_Animator and Blender_Camera_Animator on first use
+    and caches them in _pipeline_modules. Reloads them on every later call if DEV_RELOAD_ENV_VAR is "1".
+    Raises ImportError if any of them cannot be imported.
+    """
+    if _pipeline_modules:
+        if os.environ.get(DEV_RELOAD_ENV_VAR) == "1":
+            for module_name, module in list(_pipeline_modules.items()):
+                _pipeline_modules[module_name] = importlib.reload(module)
+                print(f"Reloaded {module_name}.")
+        return _pipeline_modules
+
+    # Check that every script can be found before importing any of them, so a missing script
+    # does not leave the others imported (and their module code run) for nothing
+    missing = [module_name for module_name in PIPELINE_MODULE_NAMES if importlib.util.find_spec(module_name) is None]
+    if missing:
+        raise ImportError(f"Pipeline script(s) not found on sys.path: {', '.join(missing)}")
+
+    # First call: a fresh import already runs the latest code, so there is nothing to reload yet
+    modules = {}
+    for module_name in PIPELINE_MODULE_NAMES:
+        modules[module_name] = importlib.import_module(module_name)
+
+    _pipeline_modules.update(modules)
+    print(f"Successfully imported {', '.join(PIPELINE_MODULE_NAMES)}.")
+    return _pipeline_modules
+
+
 # Global variable to store results from Stats_Generator for the callback
 _stats_generator_results = None
 
 
-def stats_generator_completion_callback(model_collection_name, all_model_data_list):
+# Per-model numeric fields kept from Stats_Generator's output (categories are kept in a separate list)
+MODEL_DATA_DTYPE = [('data_value', 'f8'), ('world_x_pos', 'f8'), ('world_top_z', 'f8')]
+
+
+def stats_generator_completion_callback(model_collection_name, model_data_rows):
     """
     Callback function executed by Stats_Generator after all models are placed.
+    model_data_rows is any iterable (list or generator) of per-model dicts with DataValue, Category,
+    world_x_pos and world_top_z. It is consumed once into a NumPy structured array plus a list of
+    categories, so no per-model dicts need to be kept around.
     This function then triggers the graph and camera animation.
     """
     global _stats_generator_results
+    category_labels = []
+    get_numeric_fields = itemgetter('DataValue', 'world_x_pos', 'world_top_z')
+
+    def numeric_rows():
+        for model_data in model_data_rows:
+            category_labels.append(model_data['Category'])
+            yield get_numeric_fields(model_data)
+
+    model_arrays = np.fromiter(numeric_rows(), dtype=MODEL_DATA_DTYPE)
     _stats_generator_results = {
         "model_collection_name": model_collection_name,
-        "all_model_data": all_model_data_list  # This now includes DataValue, Category, world_x_pos, world_top_z
+        "model_arrays": model_arrays,  # data_value, world_x_pos, world_top_z per model
+        "category_labels": category_labels
     }
     print_status("Stats_Generator finished. Proceeding to Graph and Camera Animation.")
 
-    # Schedule the next step to run after this callback completes
-    bpy.app.timers.register(_run_graph_and_camera_animation_step, first_interval=0.1)
+    # Run the next step right away. Only huge runs go through a timer, so the UI can refresh in between.
+    if (GLOBAL_SCENE_CONFIG["USE_TIMER_YIELD"]
+            and len(model_arrays) > GLOBAL_SCENE_CONFIG["TIMER_YIELD_MIN_MODELS"]):
+        bpy.app.timers.register(_run_graph_and_camera_animation_step, first_interval=0.1)
+    else:
+        _run_graph_and_camera_animation_step()
 
 
 def _run_graph_and_camera_animation_step():
     """
     Internal function to run graph and camera animation,
-    called by the timer after Stats_Generator completes.
+    called after Stats_Generator completes (directly, or by a timer on very large runs).
     """
     global _stats_generator_results
     if not _stats_generator_results:
         print("Error: Stats_Generator results not available. Cannot proceed.")
         return
 
+    Blender_Graph_Animator = _pipeline_modules["Blender_Graph_Animator"]
+    Blender_Camera_Animator = _pipeline_modules["Blender_Camera_Animator"]
+    scene = bpy.context.scene
+
     model_collection_name = _stats_generator_results["model_collection_name"]
-    all_model_data = _stats_generator_results["all_model_data"]  # This contains the x_pos and top_z for each model
+    model_arrays = _stats_generator_results["model_arrays"]  # This contains the x_pos and top_z for each model
 
     # --- Extract data for the graph directly from Stats_Generator's output ---
-    graph_data_values = [d['DataValue'] for d in all_model_data]
-    graph_category_labels = [d['Category'] for d in all_model_data]
+    graph_data_values = model_arrays['data_value'].tolist()
+    graph_category_labels = _stats_generator_results["category_labels"]
 
-    # Also prepare the graph_point_positions for Blender_Graph_Animator
+    # Also prepare the graph_point_positions for Blender_Graph_Animator, passed as arrays
     # This ensures the graph points align perfectly with the stats models
-    graph_point_positions_for_graph = [
-        {'x_pos': d['world_x_pos'], 'base_z': d['world_top_z']}
-        for d in all_model_data
-    ]
+    graph_point_positions_for_graph = {'x_pos': model_arrays['world_x_pos'], 'base_z': model_arrays['world_top_z']}
 
     # Determine animation end frame based on data length
     graph_number_of_data = len(graph_data_values)
     if graph_number_of_data == 0:
         print(
             "Warning: No valid data for graph generation from Stats_Generator output. Graph animation will be skipped.")
-        graph_anim_end_frame = STATS_GENERATOR_CONFIG["BATCH_SIZE"] * 10  # Fallback
+        graph_anim_end_frame = 100  # Fallback
     else:
         graph_anim_end_frame = GRAPH_ANIMATOR_CONFIG["GRAPH_ANIM_START_FRAME"] + \
                                GRAPH_ANIMATOR_CONFIG["GRAPH_ANIM_LENGTH_DATA"] * (graph_number_of_data - 1)
@@ -301,8 +371,8 @@ def _run_graph_and_camera_animation_step():
         graph_curve_object_name = graph_results["curve_object_name"]
         graph_animated_object_name = graph_results["animated_object_name"]
         # Update global scene end frame based on graph animation if it's longer
-        if graph_results["animation_end_frame"] > bpy.context.scene.frame_end:
-            bpy.context.scene.frame_end = graph_results["animation_end_frame"] + 50
+        if graph_results["animation_end_frame"] > scene.frame_end:
+            scene.frame_end = graph_results["animation_end_frame"] + 50
 
     # --- Step 3: Generate Camera Animation ---
     print_status("Generating Camera Animation...")
@@ -312,7 +382,7 @@ def _run_graph_and_camera_animation_step():
         graph_curve_object_name=graph_curve_object_name,
         graph_animated_object_name=graph_animated_object_name,
         animation_start_frame=GRAPH_ANIMATOR_CONFIG["GRAPH_ANIM_START_FRAME"],
-        animation_end_frame=bpy.context.scene.frame_end,
+        animation_end_frame=scene.frame_end,
         min_camera_clearance=CAMERA_ANIMATOR_CONFIG["MIN_CAMERA_CLEARANCE"],
         dynamic_movement_intensity=CAMERA_ANIMATOR_CONFIG["DYNAMIC_MOVEMENT_INTENSITY"],
         # --- NEW PARAMETERS PASSED ---
@@ -337,6 +407,7 @@ def _run_graph_and_camera_animation_step():
             print(f"Blender file saved to: {GLOBAL_SCENE_CONFIG['BLENDER_SAVE_PATH']}")
         except Exception as e:
             print(f"Error saving Blender file: {e}")
+            import traceback  # Only needed once something has gone wrong
             traceback.print_exc()
 
     print("\n" + "=" * 50)
@@ -352,13 +423,21 @@ class InitAnimationOperator(bpy.types.Operator):
 
     def execute(self, context):
         try:
-            # Check if all modules were successfully imported before proceeding
-            if not (stats_generator_imported and blender_graph_animator_imported and blender_camera_animator_imported):
+            # Import the pipeline scripts on first use (cached for later clicks)
+            try:
+                Stats_Generator = load_pipeline_modules()["Stats_Generator"]
+            except ImportError as e:
+                print(f"Error importing required scripts: {e}")
+                print(
+                    "Please ensure 'Stats_Generator.py', 'Blender_Graph_Animator.py', and 'Blender_Camera_Animator.py' are in the directory specified in 'script_dir'.")
                 self.report({'ERROR'}, "Required scripts did not import successfully. Check console for details.")
                 return {'CANCELLED'}
 
             if GLOBAL_SCENE_CONFIG["REBUILD_ALL_ON_RUN"]:
-                clear_all_script_generated_elements()
+                # The current model's duplicates are kept for Stats_Generator to recycle; those of other
+                # models (e.g. after changing MODEL_PATH) are removed like everything else
+                clear_all_script_generated_elements(keep_collection_names={
+                    get_recycled_duplicates_collection_name(STATS_GENERATOR_CONFIG["MODEL_PATH"])})
 
             print_status("Starting Stats Model Generation...")
             # Stats_Generator will call stats_generator_completion_callback when done
@@ -388,6 +467,7 @@ class InitAnimationOperator(bpy.types.Operator):
             return {'FINISHED'}
         except Exception as e:
             print(f"An error occurred during pipeline initiation: {e}")
+            import traceback  # Only needed once something has gone wrong
             traceback.print_exc()
             self.report({'ERROR'}, f"Pipeline initiation failed: {e}")
             return {'CANCELLED'}
@@ -405,19 +485,27 @@ class VIEW3D_PT_tools_init_animation(bpy.types.Panel):
         layout.operator(InitAnimationOperator.bl_idname)
 
 
+# True while this module's classes are registered. Read back from globals() so the flag
+# survives importlib.reload, and the first load skips the unregister teardown entirely.
+_REGISTERED = globals().get('_REGISTERED', False)
+
+
 def register():
-    # Ensure unregister is called first to prevent re-registration errors
-    try:
+    global _REGISTERED
+    # Only tear down a previous registration when there is one (i.e. on reload)
+    if _REGISTERED:
         unregister()
-    except RuntimeError:
-        pass  # Ignore if not registered yet or already handled by `main` block
 
     bpy.utils.register_class(InitAnimationOperator)
     bpy.utils.register_class(VIEW3D_PT_tools_init_animation)  # Register the new class
+    _REGISTERED = True
     print("InitAnimationOperator and Panel registered.")
 
 
 def unregister():
+    global _REGISTERED
+    _REGISTERED = False
+
     # Unregister the operator first
     try:
         bpy.utils.unregister_class(InitAnimationOperator)
@@ -440,25 +528,15 @@ if __name__ == "__main__":
     print("--- Running Init_Blender_Animation.py as main ---")
 
     # Attempt to unregister classes from other modules first
-    for module_name in ["Stats_Generator", "Blender_Graph_Animator", "Blender_Camera_Animator"]:
-        if module_name in sys.modules:
-            module = sys.modules[module_name]
-            if hasattr(module, 'unregister') and callable(module.unregister):
-                try:
-                    module.unregister()
-                    print(f"Attempted unregister for {module_name}")
-                except Exception:
-                    pass  # Ignore if not registered or error during unregister
-
-    # Now, unregister and register classes from *this* module.
-    # The unregister() function in this file is designed to handle missing classes gracefully.
-    try:
-        unregister()
-        print("Successfully unregistered Init_Blender_Animation classes (if registered).")
-    except Exception as e:
-        print(f"Warning: Error during unregister of Init_Blender_Animation classes: {e}")
-        traceback.print_exc()
-        pass  # Continue even if unregister fails for some reason
-
+    for module_name in PIPELINE_MODULE_NAMES:
+        module = sys.modules.get(module_name)
+        if module is not None:
+            try:
+                getattr(module, 'unregister', lambda: None)()
+                print(f"Attempted unregister for {module_name}")
+            except Exception:
+                pass  # Ignore if not registered or error during unregister
+
+    # register() unregisters this module's classes first only if they were registered before
     register()
-    print("Init_Blender_Animation.py loaded. Use the 'Animation Pipeline' panel in the N-panel (3D Viewport) to run.")
\ No newline at end of file
+    print("Init_Blender_Animation.py loaded. Use the 'Animation Pipeline' panel in the N-panel (3D Viewport) to run.")
@@ -1,10 +1,21 @@
 import bpy
 import csv
 import math
-from mathutils import Vector
+import numpy as np
+from operator import itemgetter
+from mathutils import Matrix, Vector
 import os  # For getting base name of the model file
 import traceback
 
+# Optional: numba JIT-compiles the model layout math when it is installed
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# Global Blender version for compatibility checks
+MAJOR_VERSION, MINOR_VERSION, SUB_VERSION = bpy.app.version
+
 # --- Configuration Defaults (can be overridden by the Init script) ---
 DEFAULT_DATA_COLUMN_NAME = "GDP"
 DEFAULT_CATEGORY_COLUMN_NAME = "Country"
@@ -24,12 +35,19 @@ MODEL_COLOR = (0.8, 0.2, 0.1, 1.0)
 # This ensures all source models start with a consistent horizontal footprint.
 TARGET_BASE_DIMENSION = 1.0  # e.g., 1 unit for the largest horizontal dimension
 
+# Print per-model debug output inside the placement loop (slow for large data sets)
+DEBUG = False
+
+# Per-model fields of the model data. It is kept as a structure of arrays: one NumPy array per
+# numeric field and plain lists for Category and Population (which may be 'N/A').
+MODEL_DATA_FIELDS = ('Category', 'DataValue', 'Population', 'scale_factor', 'width', 'world_x_pos', 'world_top_z')
+
 # --- Batching Configuration ---
-BATCH_SIZE = 10  # Number of models to process per batch
-BATCH_DELAY_SECONDS = 0.01  # Delay between batches (can be 0 for responsiveness without explicit pause)
+BATCH_SIZE = 64  # Number of models placed per timer tick
+BATCH_DELAY_SECONDS = 0.01  # Delay between ticks (0 places all models in one synchronous pass)
 
-# --- Global variables for batching (simplified and now passed via a context dict) ---
-_batch_context = {}
+# The timer function of a batched placement still in progress, if any (see generate_stats_models)
+_placement_timer = None
 
 
 # --- Helper Functions ---
@@ -39,6 +57,30 @@ def print_debug_info(message):
     print(f"[Stats Generator DEBUG] {message}")
 
 
+def cancel_model_placement():
+    """Stops a batched model placement still in progress from a previous run, so it no longer touches the scene."""
+    global _placement_timer
+    if _placement_timer is not None:
+        if bpy.app.timers.is_registered(_placement_timer):
+            bpy.app.timers.unregister(_placement_timer)
+            print_debug_info("Cancelled the model placement still in progress from the previous run.")
+        _placement_timer = None
+
+
+def remove_data_blocks(data_blocks, data_collection):
+    """
+    Removes a list of data-blocks. Uses a single bpy.data.batch_remove call on Blender 2.93+
+    (one dependency graph update for all of them), and removes them one by one otherwise.
+    """
+    if not data_blocks:
+        return
+    if (MAJOR_VERSION, MINOR_VERSION) >= (2, 93):
+        bpy.data.batch_remove(ids=data_blocks)
+    else:
+        for data_block in data_blocks:
+            data_collection.remove(data_block)
+
+
 def get_or_create_collection(parent_collection, collection_name):
     """Gets an existing collection or creates a new one and links it to parent."""
     if collection_name in bpy.data.collections:
@@ -49,14 +91,16 @@ def get_or_create_collection(parent_collection, collection_name):
     return collection
 
 
-def clear_script_generated_elements(root_collection_name):
+def clear_script_generated_elements(root_collection_name, keep_objects=()):
     """
     Deletes all objects and collections under the specified root_collection_name,
     which are created by this script. Leaves all other collections and their contents untouched.
+    Objects in keep_objects are left in place (and so are the collections holding them).
     This is called for cleanup or when forcing a rebuild.
     """
     print_debug_info(f"Initiating cleanup for '{root_collection_name}'...")
-    bpy.ops.object.select_all(action='DESELECT')
+    for obj in list(bpy.context.view_layer.objects.selected):
+        obj.select_set(False)
 
     if root_collection_name not in bpy.data.collections:
         print_debug_info(f"Root visualization collection '{root_collection_name}' not found for cleanup. Skipping.")
@@ -67,10 +111,12 @@ def clear_script_generated_elements(root_collection_name):
     objects_to_delete = []
     collections_to_delete = []
 
+    keep_objects = set(keep_objects)
+
     def collect_for_deletion(collection):
         # Do not delete the main camera if it's in this collection
         for obj in collection.objects:
-            if obj.name != "Main_Visualization_Camera":  # Preserve the main camera
+            if obj.name != "Main_Visualization_Camera" and obj not in keep_objects:  # Preserve the main camera
                 objects_to_delete.append(obj)
         for child_coll in collection.children:
             collect_for_deletion(child_coll)
@@ -80,13 +126,18 @@ def clear_script_generated_elements(root_collection_name):
     collections_to_delete.append(root_coll)  # Add the root itself for deletion last
 
     if objects_to_delete:
+        # Built once, not per object (the root collection is part of collections_to_delete)
+        collection_names_to_delete = {c.name for c in collections_to_delete}
         for obj in objects_to_delete:
-            # Unlink from all collections it's part of
+            # Unlink from all collections it's part of, noting whether it is linked anywhere else
+            linked_elsewhere = False
             for coll in list(obj.users_collection):
-                if coll.name in [c.name for c in collections_to_delete] or coll.name == root_collection_name:
+                if coll.name in collection_names_to_delete:
                     coll.objects.unlink(obj)
+                else:
+                    linked_elsewhere = True
             # Only remove if it has no more users (i.e., not linked elsewhere)
-            if not obj.users_collection:
+            if not linked_elsewhere:
                 bpy.data.objects.remove(obj, do_unlink=True)
         print_debug_info(f"Deleted {len(objects_to_delete)} objects from '{root_collection_name}'.")
     else:
@@ -97,103 +148,162 @@ def clear_script_generated_elements(root_collection_name):
         if collection.name in bpy.data.collections:
             # Ensure the collection is empty before trying to remove it
             if not collection.objects and not collection.children:
+                print_debug_info(f"Removed collection: {collection.name}")  # Before removal, which invalidates it
                 bpy.data.collections.remove(collection)
-                print_debug_info(f"Removed collection: {collection.name}")
             else:
                 print_debug_info(f"Collection '{collection.name}' not empty, skipping removal.")
 
-    mats_to_remove = []
-    for mat in bpy.data.materials:
-        # Check if material name starts with "Model_Material" and if it's still used by any mesh
-        is_used = False
-        for mesh in bpy.data.meshes:
-            if mat in mesh.materials:
-                is_used = True
-                break
-        if not is_used and mat.name.startswith("Model_Material"):
-            mats_to_remove.append(mat)
+    # Check if material name starts with "Model_Material" and if it's still used by any mesh.
+    # The used materials are collected in one pass over the meshes instead of scanning all meshes per material.
+    used_materials = {mat for mesh in bpy.data.meshes for mat in mesh.materials if mat is not None}
+    mats_to_remove = [mat for mat in bpy.data.materials
+                      if mat.name.startswith("Model_Material") and mat not in used_materials]
 
     for mat in mats_to_remove:
+        print_debug_info(f"Removed unused material: {mat.name}")  # Before removal, which invalidates it
         bpy.data.materials.remove(mat)
-        print_debug_info(f"Removed unused material: {mat.name}")
 
     print_debug_info("Scene cleanup completed for script-generated elements.")
 
 
 def parse_csv_data(file_path, data_column_name, category_column_name, population_column_name):
-    """Parses CSV data, specifically looking for specified columns."""
-    data = []
+    """
+    Parses CSV data, specifically looking for specified columns.
+    Returns the rows sorted by data value as columns: 'DataValue' (NumPy float64 array) and
+    'ID', 'Category', 'Population' (lists). Returns an empty dict if nothing could be read.
+    """
     try:
         with open(file_path, 'r', encoding='utf-8') as csv_file:
-            reader = csv.DictReader(csv_file)
-            if data_column_name not in reader.fieldnames:
+            # Plain csv.reader: column positions are resolved once from the header,
+            # so no dict is built per row
+            reader = csv.reader(csv_file)
+            header = next(reader, [])
+            if data_column_name not in header:
                 print(f"Error: Data column '{data_column_name}' not found in CSV.")
-                return []
-            if category_column_name not in reader.fieldnames:
+                return {}
+            if category_column_name not in header:
                 print(f"Error: Category column '{category_column_name}' not found in CSV.")
-                return []
-            if population_column_name not in reader.fieldnames:
+                return {}
+            if population_column_name not in header:
                 print(f"Warning: Population column '{population_column_name}' not found in CSV. Using N/A.")
 
-            for i, row in enumerate(reader):
-                try:
-                    data_value = float(row.get(data_column_name, 0.0))
-                    category_name = row.get(category_column_name, f"Unknown {category_column_name} {i + 1}")
-                    population_value = int(
-                        row.get(population_column_name, 0)) if population_column_name in row else 'N/A'
-
-                    data.append({
-                        'ID': int(row.get('ID', i)),
-                        'Category': category_name,
-                        'Population': population_value,
-                        'DataValue': data_value
-                    })
-                except (ValueError, KeyError) as e:
-                    print(f"Skipping row {i + 2} due to parsing error: {e}. Row data: {row}")
-            data.sort(key=lambda x: x['DataValue'])
+            data_idx = header.index(data_column_name)
+            category_idx = header.index(category_column_name)
+            population_idx = header.index(population_column_name) if population_column_name in header else None
+            id_idx = header.index('ID') if 'ID' in header else None
+
+            # First pass: keep only rows that have every column and non-empty data/category values.
+            # This is a cheap string check, no conversion. Blank lines are skipped, as DictReader did.
+            row_length = max(idx for idx in (data_idx, category_idx, population_idx, id_idx) if idx is not None) + 1
+            valid_rows = []
+            incomplete_rows = []
+            for i, row in enumerate(row for row in reader if row):
+                if len(row) >= row_length and row[data_idx] and row[category_idx]:
+                    valid_rows.append((i, row))
+                else:
+                    incomplete_rows.append(i + 2)
+            if incomplete_rows:
+                print(f"Skipping {len(incomplete_rows)} row(s) with missing '{data_column_name}' or "
+                      f"'{category_column_name}' values. Rows: {incomplete_rows[:20]}")
+
+            def convert_row(i, row):
+                # A plain tuple per row (data value first, for sorting); the columns are split out afterwards
+                return (
+                    float(row[data_idx]),
+                    int(row[id_idx]) if id_idx is not None else i,
+                    row[category_idx],
+                    int(row[population_idx]) if population_idx is not None else 'N/A'
+                )
+
+            # Second pass: convert the remaining rows. One try covers the whole pass; only if a value
+            # fails to convert are the rows converted again one by one to skip the bad ones.
+            try:
+                data = [convert_row(i, row) for i, row in valid_rows]
+            except ValueError:
+                data = []
+                for i, row in valid_rows:
+                    try:
+                        data.append(convert_row(i, row))
+                    except ValueError as e:
+                        print(f"Skipping row {i + 2} due to parsing error: {e}. Row data: {row}")
+            data.sort(key=itemgetter(0))
             print(f"✅ Successfully read {len(data)} data points from CSV.")
-            return data
+            if not data:
+                return {}
+            data_values, ids, categories, populations = zip(*data)
+            return {
+                'ID': list(ids),
+                'Category': list(categories),
+                'Population': list(populations),
+                'DataValue': np.array(data_values, dtype=np.float64)
+            }
     except FileNotFoundError:
         print(f"Error: CSV file not found at '{file_path}'.")
-        return []
+        return {}
     except Exception as e:
         print(f"An unexpected error occurred while reading CSV file: {e}")
-        return []
+        return {}
+
 
+def get_world_bbox_corners(obj):
+    """Returns the 8 corners of an object's bounding box in world space as an (8, 3) NumPy array."""
+    matrix_world = np.array(obj.matrix_world)
+    local_corners = np.array([corner[:] for corner in obj.bound_box])
+    return local_corners @ matrix_world[:3, :3].T + matrix_world[:3, 3]
 
-def get_bounding_box_dimensions(obj):
-    """Returns the width, depth, and height of an object's bounding box in world space."""
-    bpy.context.view_layer.update()
-    bbox_corners = [obj.matrix_world @ Vector(corner) for corner in obj.bound_box]
-    xs = [v.x for v in bbox_corners]
-    ys = [v.y for v in bbox_corners]
-    zs = [v.z for v in bbox_corners]
-    return max(xs) - min(xs), max(ys) - min(ys), max(zs) - min(zs)
 
+def get_bounding_box_dimensions(obj, skip_update=False):
+    """
+    Returns the width, depth, and height of an object's bounding box in world space.
+    Pass skip_update=True if the view layer was just updated and nothing has moved since.
+    """
+    if not skip_update:
+        bpy.context.view_layer.update()
+    world_corners = get_world_bbox_corners(obj)
+    width, depth, height = (world_corners.max(axis=0) - world_corners.min(axis=0)).tolist()
+    return width, depth, height
+
+
+def get_mesh_dimensions(mesh):
+    """
+    Returns the width, depth, and height of a mesh's vertices in its own (local) space.
+    Reads all vertex coordinates in one foreach_get call; needs no view layer update.
+    """
+    if not mesh.vertices:
+        return 0.0, 0.0, 0.0
+    coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get('co', coords)
+    width, depth, height = np.ptp(coords.reshape(-1, 3), axis=0).tolist()
+    return width, depth, height
 
-def get_combined_bounding_box_world(objects):
-    """Calculates the combined world-space bounding box for a list of objects."""
+
+def get_combined_bounding_box_world(objects, skip_update=False):
+    """
+    Calculates the combined world-space bounding box for a list of objects.
+    Pass skip_update=True if the view layer was just updated and nothing has moved since.
+    """
     if not objects:
         return None
 
-    min_coords = Vector((float('inf'), float('inf'), float('inf')))
-    max_coords = Vector((float('-inf'), float('-inf'), float('-inf')))
+    # One update up front is enough: no transforms change while the bounding boxes are read
+    if not skip_update:
+        bpy.context.view_layer.update()
+
+    min_coords = np.full(3, np.inf)
+    max_coords = np.full(3, -np.inf)
 
     for obj in objects:
-        bpy.context.view_layer.update()  # Ensure transforms are applied for accurate world bounding box calculation
         if obj.type == 'MESH' or obj.type == 'EMPTY':
-            for corner in obj.bound_box:
-                world_corner = obj.matrix_world @ Vector(corner)
-                min_coords.x = min(min_coords.x, world_corner.x)
-                min_coords.y = min(min_coords.y, world_corner.y)
-                min_coords.z = min(min_coords.z, world_corner.z)
-                max_coords.x = max(max_coords.x, world_corner.x)
-                max_coords.y = max(max_coords.y, world_corner.y)
-                max_coords.z = max(max_coords.z, world_corner.z)
-
-    if min_coords.x == float('inf'):
+            world_corners = get_world_bbox_corners(obj)
+            np.minimum(min_coords, world_corners.min(axis=0), out=min_coords)
+            np.maximum(max_coords, world_corners.max(axis=0), out=max_coords)
+
+    if min_coords[0] == np.inf:
         return None
 
+    min_coords = Vector(min_coords.tolist())
+    max_coords = Vector(max_coords.tolist())
+
     center_x = (min_coords.x + max_coords.x) / 2
     center_y = (min_coords.y + max_coords.y) / 2
 
@@ -206,18 +316,136 @@ def get_combined_bounding_box_world(objects):
     }
 
 
-def get_scaled_width_of_model(source_obj_data, scale_factor):
+def compute_scale_factors(data_values, use_linear_scaling, min_visual_scale, max_visual_scale, scaling_power):
     """
-    Calculates the width of a model if it were scaled.
-    Assumes initial rotation and base scaling are already baked into source_obj_data.
+    Maps a NumPy array of data values to visual scale factors in one vectorized pass.
+    Linear scaling normalizes the values to 0..1, logarithmic scaling normalizes their logs;
+    the normalized value is raised to scaling_power and mapped onto min..max visual scale.
     """
-    temp_obj = bpy.data.objects.new("TempModelDimCalc", source_obj_data)
-    bpy.context.collection.objects.link(temp_obj)
-    temp_obj.scale = (scale_factor, scale_factor, scale_factor)
-    bpy.context.view_layer.update()
-    width, _, _ = get_bounding_box_dimensions(temp_obj)
-    bpy.data.objects.remove(temp_obj, do_unlink=True)
-    return width
+    scale_factors = np.full(len(data_values), float(min_visual_scale))
+    if len(data_values) == 0:
+        return scale_factors
+    min_data = data_values.min()
+    max_data = data_values.max()
+    if max_data <= min_data:
+        return scale_factors
+
+    if use_linear_scaling:
+        normalized_values = (data_values - min_data) / (max_data - min_data)
+    else:
+        # Handle log scaling, avoid log(0): values <= 0 keep log(1e-9), the rest get log(value + 1e-9)
+        log_values = np.full(len(data_values), math.log(1e-9))
+        np.log(data_values + 1e-9, out=log_values, where=data_values > 0)
+        # The log is monotonic, so the log range comes straight from the log values
+        log_min_value = log_values.min()
+        log_range = log_values.max() - log_min_value
+        if log_range <= 1e-9:
+            return scale_factors
+        normalized_values = (log_values - log_min_value) / log_range
+
+    return min_visual_scale + (normalized_values ** scaling_power) * (max_visual_scale - min_visual_scale)
+
+
+def compute_x_positions(widths, proportional_gap_factor, min_clearance_between_models):
+    """
+    Returns the X center of each model when placed left to right starting at X=0.
+    The gap between two neighbours is proportional to their average width, but at least
+    min_clearance_between_models; the left edges are then a prefix sum of widths plus gaps.
+    """
+    if len(widths) == 0:
+        return np.zeros(0)
+    gaps = np.maximum(min_clearance_between_models, (widths[:-1] + widths[1:]) * 0.5 * proportional_gap_factor)
+    left_edges = np.concatenate(([0.0], np.cumsum(widths[:-1] + gaps)))
+    return left_edges + widths / 2
+
+
+def _compute_model_layout_fused(data_values, use_linear_scaling, min_visual_scale, max_visual_scale, scaling_power,
+                                base_width, base_height, proportional_gap_factor, min_clearance_between_models):
+    """
+    Single-loop version of compute_scale_factors + compute_x_positions that also returns widths and top Z.
+    Pure scalar math (no bpy, no temporary arrays), so it is JIT-compiled with numba when available.
+    """
+    num_models = data_values.shape[0]
+    scale_factors = np.empty(num_models)
+    widths = np.empty(num_models)
+    x_positions = np.empty(num_models)
+    top_zs = np.empty(num_models)
+    if num_models == 0:
+        return scale_factors, widths, x_positions, top_zs
+
+    min_data = data_values.min()
+    max_data = data_values.max()
+    # Offset and reciprocal range of the normalization; a constant layout uses min_visual_scale throughout
+    if use_linear_scaling:
+        offset = min_data
+        value_range = max_data - min_data
+        is_constant = not (max_data > min_data)
+    else:
+        # Handle log scaling, avoid log(0)
+        offset = math.log(min_data + 1e-9) if min_data > 0 else math.log(1e-9)
+        log_max_value = math.log(max_data + 1e-9) if max_data > 0 else math.log(1e-9)
+        value_range = log_max_value - offset
+        is_constant = not (max_data > min_data) or value_range <= 1e-9
+    inv_range = 0.0 if is_constant else 1.0 / value_range
+    scale_span = max_visual_scale - min_visual_scale
+
+    left_edge = 0.0
+    previous_width = 0.0
+    for i in range(num_models):
+        if is_constant:
+            scale_factor = min_visual_scale
+        else:
+            value = data_values[i]
+            if not use_linear_scaling:
+                value = math.log(value + 1e-9) if value > 0 else math.log(1e-9)
+            scale_factor = min_visual_scale + ((value - offset) * inv_range) ** scaling_power * scale_span
+        width = base_width * scale_factor
+
+        # The left edge advances by the previous width plus the gap between the previous model and this one
+        if i > 0:
+            left_edge += previous_width + max(min_clearance_between_models,
+                                              (previous_width + width) * 0.5 * proportional_gap_factor)
+
+        scale_factors[i] = scale_factor
+        widths[i] = width
+        x_positions[i] = left_edge + width / 2
+        top_zs[i] = base_height * scale_factor
+        previous_width = width
+
+    return scale_factors, widths, x_positions, top_zs
+
+
+# Whether _compute_model_layout_fused is JIT-compiled; compute_model_layout uses the NumPy helpers otherwise
+_LAYOUT_JIT = False
+if numba is not None:
+    try:
+        # No fastmath, so the compiled layout matches the NumPy path
+        _compute_model_layout_fused = numba.njit(cache=True)(_compute_model_layout_fused)
+        _LAYOUT_JIT = True
+    except RuntimeError as e:
+        # numba can't cache functions without a source file on disk (e.g. run from Blender's Text Editor)
+        print(f"numba JIT unavailable for model layout, using NumPy: {e}")
+
+
+def compute_model_layout(data_values, use_linear_scaling, min_visual_scale, max_visual_scale, scaling_power,
+                         base_width, base_height, proportional_gap_factor, min_clearance_between_models):
+    """
+    Returns (scale_factors, widths, x_positions, top_zs) arrays for all models.
+    Uses the fused numba kernel when it could be compiled, and the vectorized NumPy helpers otherwise.
+    """
+    if _LAYOUT_JIT:
+        return _compute_model_layout_fused(
+            data_values, use_linear_scaling, float(min_visual_scale), float(max_visual_scale), float(scaling_power),
+            float(base_width), float(base_height), float(proportional_gap_factor),
+            float(min_clearance_between_models))
+
+    scale_factors = compute_scale_factors(data_values, use_linear_scaling, min_visual_scale, max_visual_scale,
+                                          scaling_power)
+    widths = base_width * scale_factors
+    x_positions = compute_x_positions(widths, proportional_gap_factor, min_clearance_between_models)
+    # The scale is uniform, so the top Z is the scaled base height
+    top_zs = base_height * scale_factors
+    return scale_factors, widths, x_positions, top_zs
 
 
 def setup_materials(model_color):
@@ -237,105 +465,110 @@ def setup_materials(model_color):
     return {"model": mat}
 
 
-def _process_models_batch():
+def iter_model_data(model_data):
     """
-    Processes a batch of models. Uses a global _batch_context dictionary
-    to access necessary variables. This function is registered as a Blender timer.
+    Yields one dict per model (keyed by MODEL_DATA_FIELDS) from the structure-of-arrays model data,
+    for consumers such as the completion callback that work on one model at a time.
     """
-    context = _batch_context
-
-    model_data_to_process = context['model_data_to_process']
-    source_model_obj = context['source_model_obj']
-    materials = context['materials']
-    duplicates_collection = context['duplicates_collection']
-    data_column_name_for_batch = context['data_column_name_for_batch']
-    proportional_gap_factor = context['proportional_gap_factor']
-    min_clearance_between_models = context['min_clearance_between_models']
-
-    # Update batch indices *before* processing this batch
-    batch_start = context['current_model_index']
-    batch_end = min(context['current_model_index'] + BATCH_SIZE, len(model_data_to_process))
-    context['current_model_index'] = batch_end  # Update for the next batch
-
-    if not source_model_obj or not source_model_obj.data:
-        print("Error: Source model or its data is missing. Cannot process batch.")
-        bpy.app.timers.unregister(_process_models_batch)
-        context['cleanup_func'](context['root_collection_name'])
-        return
+    columns = [model_data[field] for field in MODEL_DATA_FIELDS]
+    columns = [column.tolist() if isinstance(column, np.ndarray) else column for column in columns]
+    for values in zip(*columns):
+        yield dict(zip(MODEL_DATA_FIELDS, values))
 
-    for i in range(batch_start, batch_end):
-        model_data = model_data_to_process[i]
-        category = model_data['Category']
-        data_value = model_data['DataValue']
-        scale_factor = model_data['scale_factor']
-        current_model_width = model_data['width']
-
-        # Determine the X position for the *current* model
-        # The origin of the model is at its bottom-center after normalization.
-        # So, to place its left edge at 'current_x_position_for_next_model',
-        # its center needs to be at 'current_x_position_for_next_model + current_model_width / 2'.
-        x_position_for_current_model = context['current_x_position_for_next_model'] + (current_model_width / 2)
-
-        duplicated_obj = source_model_obj.copy()
-        duplicated_obj.data = source_model_obj.data.copy()
-        duplicated_obj.name = f"VizModel_{category}"
-        duplicates_collection.objects.link(duplicated_obj)
-
-        if materials["model"]:
-            if len(duplicated_obj.data.materials) == 0:
-                duplicated_obj.data.materials.append(materials["model"])
-            else:
-                duplicated_obj.data.materials[0] = materials["model"]
 
+def assign_model_objects(names, source_model_obj, model_pool=()):
+    """
+    Matches the objects in model_pool (duplicates kept from a previous run, still linked to the
+    duplicates collection) to the model names: first those already named for a model (no rename needed),
+    then the spare ones. Recycled objects get the source mesh and transform back; pooled objects left
+    over are removed. Returns one object per name, or None where a new duplicate has to be created.
+    """
+    pooled_by_name = {obj.name: obj for obj in model_pool}
+    model_objs = [pooled_by_name.pop(name, None) for name in names]
+    spare_objs = list(pooled_by_name.values())
+    if not model_pool:
+        return model_objs
+
+    for i, name in enumerate(names):
+        if not spare_objs:
+            break
+        if model_objs[i] is None:
+            model_objs[i] = spare_objs.pop()
+            model_objs[i].name = name
+    recycled_objs = [obj for obj in model_objs if obj is not None]
+
+    # Recycled objects get the (possibly re-imported) source mesh and the source transform back
+    source_mesh_data = source_model_obj.data
+    source_matrix_basis = source_model_obj.matrix_basis.copy()
+    old_meshes = {obj.data for obj in model_pool} - {source_mesh_data}
+    for recycled_obj in recycled_objs:
+        if recycled_obj.data != source_mesh_data:
+            recycled_obj.data = source_mesh_data
+        recycled_obj.matrix_basis = source_matrix_basis
+    # Remove the pooled objects that were not needed, then the old meshes nothing uses any more
+    remove_data_blocks(spare_objs, bpy.data.objects)
+    unused_meshes = [mesh for mesh in old_meshes if not mesh.users]
+    remove_data_blocks(unused_meshes, bpy.data.meshes)
+    print_debug_info(f"Recycled {len(recycled_objs)} existing model objects, removed {len(spare_objs)} spare ones.")
+    return model_objs
+
+
+def place_models(model_data, model_objs, source_model_obj, duplicates_collection, data_column_name,
+                 start=0, end=None):
+    """
+    Places the models start..end of model_data (all of them by default) at their precomputed
+    'world_x_pos', scaled by their 'scale_factor'. Uses the objects in model_objs (see assign_model_objects)
+    and creates a new object sharing the source mesh where there is none.
+    """
+    model_slice = slice(start, end)
+    # Plain Python floats for the per-object loop (indexing NumPy arrays element by element is slow)
+    data_values = model_data['DataValue'][model_slice].tolist()
+    scale_factors = model_data['scale_factor'][model_slice].tolist()
+    widths = model_data['width'][model_slice].tolist()
+    x_positions = model_data['world_x_pos'][model_slice].tolist()
+    top_zs = model_data['world_top_z'][model_slice].tolist()
+    categories = model_data['Category'][model_slice]
+    populations = model_data['Population'][model_slice]
+
+    # New duplicates are created and set up first, then linked to the collection in one sweep at the end
+    new_objs = []
+    # A bare object on the shared source mesh, so all duplicates use one mesh (and its material). Its rotation
+    # and scale are baked into the mesh, so nothing else needs copying from the source object.
+    source_mesh_data = source_model_obj.data
+    new_object = bpy.data.objects.new  # Bound once instead of looked up for every model
+    for i in range(start, start + len(categories)):
+        if model_objs[i] is None:
+            model_objs[i] = new_object(f"VizModel_{model_data['Category'][i]}", source_mesh_data)
+            new_objs.append(model_objs[i])
+
+    for (duplicated_obj, category, population, data_value, scale_factor, width, x_position_for_current_model,
+         top_z) in zip(model_objs[model_slice], categories, populations, data_values, scale_factors, widths,
+                       x_positions, top_zs):
+
+        # The data-driven scale stays on the object; location and initial rotation/scale are baked into the mesh.
         duplicated_obj.scale = (scale_factor, scale_factor, scale_factor)
-        bpy.context.view_layer.objects.active = duplicated_obj
-        duplicated_obj.select_set(True)
-        # Apply only the new data-driven scale here. Location and initial rotation/scale are baked.
-        bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-        duplicated_obj.select_set(False)
 
         # Since the source model's origin is now at its bottom-center and its initial transforms are baked,
         # setting duplicated_obj.location.z to 0 will place its base on the ground.
-        # Use the newly calculated x_position_for_current_model.
+        # Use the precomputed x_position_for_current_model.
         duplicated_obj.location = (x_position_for_current_model, 0, 0)
 
-        # --- Store final world position and top Z for graph alignment ---
-        bpy.context.view_layer.update()  # Ensure location and scale are applied before bbox calc
-        width, depth, height = get_bounding_box_dimensions(duplicated_obj)
-
-        # The origin is at the bottom-center, so top_z is just height
-        model_data['world_x_pos'] = duplicated_obj.location.x
-        model_data['world_top_z'] = height  # Assuming origin is at Z=0, height is directly top Z
-        # --- End storing positions ---
-
         # Custom properties
         duplicated_obj["Category"] = category
-        duplicated_obj["Population"] = model_data['Population']
-        duplicated_obj[data_column_name_for_batch] = data_value
-
-        proportional_gap_part = 0.0
-        if i < len(model_data_to_process) - 1:
-            next_model_width = model_data_to_process[i + 1]['width']
-            proportional_gap_part = (current_model_width / 2 + next_model_width / 2) * proportional_gap_factor
-
-        total_gap = max(min_clearance_between_models, proportional_gap_part)
-
-        # Update the starting X position for the *next* model
-        context['current_x_position_for_next_model'] += current_model_width + total_gap
-
-        print_debug_info(
-            f"Placed {duplicated_obj.name} (Scale: {scale_factor:.2f}, Width: {current_model_width:.2f}) at X={duplicated_obj.location.x:.2f}, Top Z={model_data['world_top_z']:.2f}")
+        duplicated_obj["Population"] = population
+        duplicated_obj[data_column_name] = data_value
+        # Layout, read back directly when the models are reused instead of rebuilt
+        duplicated_obj["world_x_pos"] = x_position_for_current_model
+        duplicated_obj["world_top_z"] = top_z
+        duplicated_obj["width"] = width
+
+        if DEBUG:
+            print_debug_info(
+                f"Placed {duplicated_obj.name} (Scale: {scale_factor:.2f}, Width: {width:.2f}) at X={x_position_for_current_model:.2f}, Top Z={top_z:.2f}")
 
-    if context['current_model_index'] < len(model_data_to_process):
-        # Schedule the next batch
-        bpy.app.timers.register(_process_models_batch, first_interval=BATCH_DELAY_SECONDS)
-    else:
-        print_debug_info("All model batches processed. Stats generation finished!")
-        # Call the completion callback if provided
-        if 'completion_callback' in context and context['completion_callback']:
-            # Pass the updated model_data_to_process which now includes world_x_pos and world_top_z
-            context['completion_callback'](context['duplicates_collection'].name, model_data_to_process)
-        _batch_context.clear()  # Clear global context after completion
+    link_to_duplicates = duplicates_collection.objects.link
+    for duplicated_obj in new_objs:
+        link_to_duplicates(duplicated_obj)
 
 
 # --- Main Script Execution Function (Programmatic Entry Point) ---
@@ -359,28 +592,39 @@ def generate_stats_models(
         batch_size: int = BATCH_SIZE,
         batch_delay_seconds: float = BATCH_DELAY_SECONDS,
         rebuild_on_run: bool = False,  # New parameter to control rebuild
-        completion_callback=None  # Callback function to run after all batches are done
+        completion_callback=None  # Callback function to run after all models are placed
 ):
     """
     Generates 3D models based on statistical data from a CSV file.
     This function is designed to be called programmatically.
+    The returned "all_model_data" holds one array (or list) per field in MODEL_DATA_FIELDS. It is the same
+    structure the placement reads from (not a copy), and its layout is final even while models are still being placed.
+    Models are placed batch_size per timer tick, batch_delay_seconds apart (all at once when the delay is 0);
+    completion_callback runs once the last model is placed.
     """
-    global _batch_context
-    _batch_context.clear()  # Ensure context is clean for a new run
+    global _placement_timer
 
     print("\n" + "=" * 50)
     print("STARTING BLENDER STATS GENERATOR SCRIPT (Programmatic Call)")
     print("=" * 50)
 
+    # A placement left running by a previous run would keep writing into objects this run replaces
+    cancel_model_placement()
+
     model_file_name = os.path.splitext(os.path.basename(model_path))[0]
     root_collection_name = f"{visualization_name}_{model_file_name}"
     source_collection_name = f"Source_{model_file_name}_Model"
     duplicates_collection_name = f"Viz_{model_file_name}_Duplicates"
 
     # --- Check for existing visualization and handle rebuild ---
+    model_pool = []
     if rebuild_on_run:
         print_debug_info(f"Rebuild requested. Clearing existing elements under '{root_collection_name}'.")
-        clear_script_generated_elements(root_collection_name)
+        # Existing model duplicates are kept as a pool and recycled by place_models instead of being recreated
+        existing_duplicates_coll = bpy.data.collections.get(duplicates_collection_name)
+        if existing_duplicates_coll:
+            model_pool = [obj for obj in existing_duplicates_coll.objects if obj.type == 'MESH']
+        clear_script_generated_elements(root_collection_name, keep_objects=model_pool)
     else:
         # If not rebuilding, check if the main duplicates collection already exists and has content
         existing_duplicates_coll = bpy.data.collections.get(duplicates_collection_name)
@@ -389,27 +633,37 @@ def generate_stats_models(
                 f"Existing models found in '{duplicates_collection_name}'. Skipping generation as rebuild_on_run is False.")
             # If skipping, we still need to provide the collection name and existing model data for the camera script
             # We need to re-collect the existing model positions if we're skipping generation
-            existing_model_data = []
-            for obj in existing_duplicates_coll.objects:
-                if obj.type == 'MESH':
-                    bpy.context.view_layer.update()  # Ensure transforms are applied
-                    width, depth, height = get_bounding_box_dimensions(obj)
-                    existing_model_data.append({
-                        'Category': obj.get("Category", obj.name),
-                        'DataValue': obj.get(data_column_name, 0.0),  # Retrieve from custom prop
-                        'Population': obj.get("Population", 'N/A'),
-                        'scale_factor': obj.scale.x,  # Assuming uniform scale
-                        'width': width,
-                        'world_x_pos': obj.location.x,
-                        'world_top_z': height  # Assuming origin at Z=0
-                    })
-            # Ensure existing_model_data is sorted by X-position for consistency
-            existing_model_data.sort(key=lambda x: x['world_x_pos'])
+            # Ensure the existing models are sorted by X-position for consistency
+            existing_objs = sorted((obj for obj in existing_duplicates_coll.objects if obj.type == 'MESH'),
+                                   key=lambda obj: obj.get("world_x_pos", obj.location.x))
+            # place_models stores each model's layout as custom properties; models without them
+            # (made by older versions of this script) are measured from their bounding box instead
+            layouts = []  # (world_x_pos, world_top_z, width) per model
+            view_layer_updated = False
+            for obj in existing_objs:
+                if "world_x_pos" in obj and "world_top_z" in obj and "width" in obj:
+                    layouts.append((obj["world_x_pos"], obj["world_top_z"], obj["width"]))
+                else:
+                    if not view_layer_updated:
+                        bpy.context.view_layer.update()  # Ensure transforms are applied (once, before reading any of them)
+                        view_layer_updated = True
+                    width, depth, height = get_bounding_box_dimensions(obj, skip_update=True)
+                    layouts.append((obj.location.x, height, width))  # Assuming origin at Z=0
+            existing_model_data = {
+                'Category': [obj.get("Category", obj.name) for obj in existing_objs],
+                'DataValue': np.array([obj.get(data_column_name, 0.0) for obj in existing_objs], dtype=np.float64),
+                'Population': [obj.get("Population", 'N/A') for obj in existing_objs],
+                'scale_factor': np.array([obj.scale.x for obj in existing_objs]),  # Assuming uniform scale
+                'width': np.array([width for _, _, width in layouts]),
+                'world_x_pos': np.array([x_pos for x_pos, _, _ in layouts]),
+                'world_top_z': np.array([top_z for _, top_z, _ in layouts])
+            }
 
             if completion_callback:
-                completion_callback(duplicates_collection_name, existing_model_data)
+                completion_callback(duplicates_collection_name, iter_model_data(existing_model_data))
             return {
                 "model_collection_name": duplicates_collection_name,
+                "model_count": len(existing_objs),
                 "all_model_data": existing_model_data
             }
 
@@ -437,7 +691,9 @@ def generate_stats_models(
         else:
             bpy.ops.import_scene.gltf(filepath=model_path)
             imported_objects = [obj for obj in bpy.context.selected_objects]
-            bpy.ops.object.select_all(action='DESELECT')
+            # The importer leaves exactly the imported objects selected
+            for obj in imported_objects:
+                obj.select_set(False)
 
             if not imported_objects:
                 print(f"Error: No objects were imported or selected after GLTF import from '{model_path}'.")
@@ -451,14 +707,17 @@ def generate_stats_models(
             all_imported_scene_objects = []
             for obj in imported_objects:
                 # Unlink from any default collections (like Scene Collection)
-                for coll in obj.users_collection:
+                for coll in list(obj.users_collection):
                     if coll != temp_import_collection:
                         coll.objects.unlink(obj)
                 temp_import_collection.objects.link(obj)  # Link to temp collection
                 all_imported_scene_objects.append(obj)
 
+            # A single update after all objects are linked, before any bounding box is read
+            bpy.context.view_layer.update()
+
             # Calculate combined bounding box of all objects imported from the GLTF scene
-            combined_bounds = get_combined_bounding_box_world(all_imported_scene_objects)
+            combined_bounds = get_combined_bounding_box_world(all_imported_scene_objects, skip_update=True)
 
             if combined_bounds:
                 # Calculate the translation needed to move bottom-center to (0,0,0)
@@ -501,26 +760,27 @@ def generate_stats_models(
                 return None
 
             # --- Set Source Model Origin to its Bottom Center (locally) and apply initial transforms ---
-            bpy.context.view_layer.objects.active = source_model_obj
-            source_model_obj.select_set(True)
-            bpy.context.view_layer.update()
+            # Transforms are baked by transforming the mesh data directly (no operators, selection or 3D cursor)
+            source_mesh_data = source_model_obj.data
 
             # Apply the desired initial rotation first
             source_model_obj.rotation_euler = initial_model_rotation
-            bpy.ops.object.transform_apply(location=False, rotation=True, scale=False)  # Bake rotation
-
-            # Calculate world position of the source model's bottom-center for setting cursor
-            bbox_corners_world = [source_model_obj.matrix_world @ Vector(corner) for corner in
-                                  source_model_obj.bound_box]
-            world_min_z = min(v.z for v in bbox_corners_world)
-            world_center_x = (min(v.x for v in bbox_corners_world) + max(v.x for v in bbox_corners_world)) / 2
-            world_center_y = (min(v.y for v in bbox_corners_world) + max(v.y for v in bbox_corners_world)) / 2
+            # Bake rotation: rotate the mesh by the object's current rotation (in whichever rotation mode), then reset it
+            rotation = source_model_obj.matrix_basis.decompose()[1]
+            source_mesh_data.transform(rotation.to_matrix().to_4x4())
+            source_model_obj.rotation_euler = (0, 0, 0)
+            source_model_obj.rotation_quaternion = (1, 0, 0, 0)
+            bpy.context.view_layer.update()
 
-            # Set 3D cursor to this world bottom-center position
-            bpy.context.scene.cursor.location = Vector((world_center_x, world_center_y, world_min_z))
+            # Calculate world position of the source model's bottom-center
+            bbox_corners_world = get_world_bbox_corners(source_model_obj)
+            world_min = bbox_corners_world.min(axis=0)
+            world_center = (world_min + bbox_corners_world.max(axis=0)) / 2
+            world_bottom_center = Vector((world_center[0], world_center[1], world_min[2]))
 
-            # Set the source_model_obj's origin to the 3D cursor's location
-            bpy.ops.object.origin_set(type='ORIGIN_CURSOR')
+            # Set the source_model_obj's origin to that point: shift the mesh so the point becomes local (0,0,0)
+            local_bottom_center = source_model_obj.matrix_world.inverted() @ world_bottom_center
+            source_mesh_data.transform(Matrix.Translation(-local_bottom_center))
 
             # Now, move the source_model_obj itself so its newly set origin is at (0,0,0) world space.
             # This places its bottom-center at (0,0,0).
@@ -529,25 +789,24 @@ def generate_stats_models(
 
             # --- Apply initial uniform scaling to match TARGET_BASE_DIMENSION ---
             bpy.context.view_layer.update()  # Update dimensions after origin set and location move
-            current_width, current_depth, _ = get_bounding_box_dimensions(source_model_obj)
+            current_width, current_depth, _ = get_bounding_box_dimensions(source_model_obj, skip_update=True)
 
             largest_horizontal_dim = max(current_width, current_depth)
 
             if largest_horizontal_dim > 1e-6:  # Avoid division by zero or very small numbers
                 base_scale_factor = target_base_dimension / largest_horizontal_dim
-                source_model_obj.scale *= base_scale_factor
-                bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)  # Bake this initial scale
+                # Bake this initial scale (together with any scale the object already had) into the mesh
+                baked_scale = source_model_obj.scale * base_scale_factor
+                source_mesh_data.transform(Matrix.Diagonal((baked_scale.x, baked_scale.y, baked_scale.z, 1.0)))
+                source_model_obj.scale = (1, 1, 1)
                 print_debug_info(
                     f"Source model scaled to target base dimension ({target_base_dimension:.2f}). Scale factor applied: {base_scale_factor:.4f}")
 
             # Final check on dimensions after all initial adjustments
-            final_initial_width, final_initial_depth, final_initial_height = get_bounding_box_dimensions(
-                source_model_obj)
+            final_initial_width, final_initial_depth, final_initial_height = get_mesh_dimensions(source_mesh_data)
             print_debug_info(
                 f"Source model final initial dimensions (W,D,H): {final_initial_width:.2f}, {final_initial_depth:.2f}, {final_initial_height:.2f}")
 
-            source_model_obj.select_set(False)
-
             # Move all objects from the temporary import collection to the final source collection
             for obj in list(temp_import_collection.objects):
                 temp_import_collection.objects.unlink(obj)
@@ -566,7 +825,6 @@ def generate_stats_models(
                 temp_import_collection.objects.unlink(obj)
                 bpy.data.objects.remove(obj, do_unlink=True)
             bpy.data.collections.remove(temp_import_collection)
-        _batch_context.clear()
         return None
 
     # --- Setup Materials ---
@@ -577,76 +835,118 @@ def generate_stats_models(
     if not world_data:
         print("No valid data parsed from CSV. Exiting.")
         clear_script_generated_elements(root_collection_name)
-        _batch_context.clear()
         return None
 
-    data_values = [d['DataValue'] for d in world_data]
-    min_data = min(data_values)
-    max_data = max(data_values)
+    data_values = world_data['DataValue']
+    min_data = float(data_values.min())
+    max_data = float(data_values.max())
     print_debug_info(f"Min '{data_column_name}': {min_data}, Max '{data_column_name}': {max_data}")
 
     # --- 4. Pre-calculate Scaled Dimensions for all Models ---
-    model_data_to_process = []
+    # The source model's rotation and base scale are baked and its origin is at its bottom-center,
+    # so a uniform data-driven scale simply multiplies its base dimensions. The duplicates are bare objects
+    # on the source mesh, so those are the mesh's own dimensions.
+    base_width, base_depth, base_height = get_mesh_dimensions(source_model_obj.data)
+
+    scale_factors, widths, x_positions, top_zs = compute_model_layout(
+        data_values, use_linear_scaling, min_visual_scale, max_visual_scale, scaling_power,
+        base_width, base_height, proportional_gap_factor, min_clearance_between_models)
+    num_models = len(data_values)
+    model_data_to_process = {
+        'Category': world_data['Category'],
+        'DataValue': data_values,
+        'Population': world_data['Population'],
+        'scale_factor': scale_factors,
+        'width': widths,
+        'world_x_pos': x_positions,  # The origin of each model is at its bottom-center, so these are X centers
+        'world_top_z': top_zs
+    }
+
+    print_debug_info(f"Pre-calculated widths for {num_models} models. Starting placement...")
+
+    # All duplicates share the source model's mesh, so its material is assigned once here
     source_mesh_data = source_model_obj.data
+    if materials["model"]:
+        if len(source_mesh_data.materials) == 0:
+            source_mesh_data.materials.append(materials["model"])
+        else:
+            source_mesh_data.materials[0] = materials["model"]
+
+    # --- 5. Create and Place all Models ---
+    model_objs = assign_model_objects(
+        [f"VizModel_{category}" for category in model_data_to_process['Category']], source_model_obj, model_pool)
+
+    placement_failed = False
+
+    def place_model_batches():
+        """
+        Places the models batch_size at a time, yielding after each batch.
+        If a batch fails, the error is reported, the partially placed visualization is removed and it stops.
+        """
+        nonlocal placement_failed
+        try:
+            for batch_start in range(0, num_models, batch_size):
+                place_models(model_data_to_process, model_objs, source_model_obj, duplicates_collection,
+                             data_column_name, batch_start, batch_start + batch_size)
+                yield
+        except Exception as e:
+            print(f"Error placing models: {e}")
+            traceback.print_exc()
+            clear_script_generated_elements(root_collection_name)
+            placement_failed = True
+
+    def finish_placement():
+        # Runs outside place_model_batches, so errors raised by the callback don't remove the placed models
+        print_debug_info("All models placed. Stats generation finished!")
+        # Call the completion callback if provided
+        if completion_callback:
+            # Pass the model data, including world_x_pos and world_top_z, one dict per model
+            completion_callback(duplicates_collection_name, iter_model_data(model_data_to_process))
+
+    model_batches = place_model_batches()
+    if batch_delay_seconds > 0 and num_models > batch_size:
+        # One timer runs the whole placement, advancing it by one batch per tick so the UI stays responsive
+        def place_next_batch():
+            global _placement_timer
+            try:
+                source_missing = not source_model_obj.data
+            except ReferenceError:  # The source model was deleted
+                source_missing = True
+            if source_missing:
+                print("Error: Source model or its data is missing. Cannot process batch.")
+                _placement_timer = None
+                clear_script_generated_elements(root_collection_name)
+                return None
+
+            try:
+                next(model_batches)
+                bpy.context.view_layer.update()  # One depsgraph update per batch
+            except StopIteration:
+                _placement_timer = None
+                if not placement_failed:
+                    finish_placement()
+                return None
+            except Exception as e:
+                # Placement errors are reported and cleaned up by place_model_batches; only report anything else
+                print(f"Error during batched model placement: {e}")
+                traceback.print_exc()
+                _placement_timer = None
+                return None
+            return batch_delay_seconds
+
+        _placement_timer = place_next_batch
+        bpy.app.timers.register(place_next_batch, first_interval=batch_delay_seconds)
+    else:
+        for _ in model_batches:
+            pass
+        if placement_failed:
+            return None
+        finish_placement()
 
-    for i, row in enumerate(world_data):
-        data_value = row['DataValue']
-        scale_factor = min_visual_scale
-        if max_data > min_data:
-            if use_linear_scaling:
-                normalized_value = (data_value - min_data) / (max_data - min_data)
-                normalized_value_powered = normalized_value ** scaling_power
-                scale_factor = min_visual_scale + (normalized_value_powered * (max_visual_scale - min_visual_scale))
-            else:
-                # Handle log scaling, avoid log(0)
-                log_min_value = math.log(min_data + 1e-9) if min_data > 0 else math.log(1e-9)
-                log_max_value = math.log(max_data + 1e-9) if max_data > 0 else math.log(1e-9)
-                log_value = math.log(data_value + 1e-9) if data_value > 0 else math.log(1e-9)
-
-                log_range = log_max_value - log_min_value
-                if log_range > 1e-9:
-                    normalized_log_value = (log_value - log_min_value) / log_range
-                    normalized_log_value_powered = normalized_log_value ** scaling_power
-                    scale_factor = min_visual_scale + (
-                            normalized_log_value_powered * (max_visual_scale - min_visual_scale))
-                else:
-                    scale_factor = min_visual_scale
-
-        calculated_width = get_scaled_width_of_model(source_mesh_data, scale_factor)
-        model_data_to_process.append({
-            'Category': row['Category'],
-            'DataValue': data_value,
-            'Population': row['Population'],
-            'scale_factor': scale_factor,
-            'width': calculated_width,
-            'world_x_pos': 0.0,  # Placeholder, will be updated in _process_models_batch
-            'world_top_z': 0.0  # Placeholder, will be updated in _process_models_batch
-        })
-
-    print_debug_info(f"Pre-calculated widths for {len(model_data_to_process)} models. Starting batched placement...")
-
-    # --- 5. Prepare and Start Batched Creation and Placement of Models ---
-    _batch_context['model_data_to_process'] = model_data_to_process
-    _batch_context['source_model_obj'] = source_model_obj
-    _batch_context['materials'] = materials
-    _batch_context['duplicates_collection'] = duplicates_collection
-    _batch_context['data_column_name_for_batch'] = data_column_name
-    _batch_context['root_collection_name'] = root_collection_name
-    _batch_context['cleanup_func'] = clear_script_generated_elements
-    _batch_context['proportional_gap_factor'] = proportional_gap_factor
-    _batch_context['min_clearance_between_models'] = min_clearance_between_models
-    _batch_context['completion_callback'] = completion_callback  # Store callback
-
-    _batch_context['current_model_index'] = 0
-    _batch_context['current_x_position_for_next_model'] = 0.0  # This now represents the left edge for the next model
-
-    # Register the first batch to be processed by Blender's timer
-    bpy.app.timers.register(_process_models_batch, first_interval=batch_delay_seconds)
-
-    # Return initial info immediately, actual model placement happens asynchronously
     return {
         "model_collection_name": duplicates_collection_name,
-        "all_model_data": model_data_to_process  # This list contains pre-calculated data, not actual objects yet
+        "model_count": num_models,
+        "all_model_data": model_data_to_process
     }
 
 # This script no longer has a direct __main__ block for running,